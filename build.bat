@@ -46,6 +46,22 @@ if errorlevel 1 (
 )
 echo.
 
+REM Step 3: Regenerate SQL reserved words module
+echo Generating SQL reserved words module...
+python scripts\gen_sql_keywords.py
+if errorlevel 1 (
+    echo   WARNING: Could not regenerate src\core\_sql_reserved.py, using checked-in copy...
+)
+echo.
+
+REM Step 4: Regenerate AI table schema validator module
+echo Generating AI table schema validator module...
+python scripts\gen_ai_table_validator.py
+if errorlevel 1 (
+    echo   WARNING: Could not regenerate src\utils\_ai_table_schema_validator.py, using checked-in copy...
+)
+echo.
+
 echo Starting PyInstaller build...
 pyinstaller widget_sidebar.spec --clean --noconfirm
 
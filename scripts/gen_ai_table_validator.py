@@ -0,0 +1,90 @@
+"""
+Genera src/utils/_ai_table_schema_validator.py a partir de
+AITableJSONValidator.SCHEMA con fastjsonschema.compile_to_code.
+
+El módulo generado es Python puro: la importación de las excepciones de
+fastjsonschema se sustituye por una clase local, de modo que no hace falta
+fastjsonschema en tiempo de ejecución.
+
+Uso:
+    python scripts/gen_ai_table_validator.py          # regenera el módulo
+    python scripts/gen_ai_table_validator.py --check  # falla si el módulo está desactualizado
+"""
+
+import ast
+import re
+import sys
+from pathlib import Path
+
+import fastjsonschema
+
+ROOT = Path(__file__).resolve().parent.parent
+VALIDATOR_FILE = ROOT / "src" / "utils" / "ai_table_json_validator.py"
+OUTPUT_FILE = ROOT / "src" / "utils" / "_ai_table_schema_validator.py"
+
+HEADER = '''"""
+Validador del schema de tablas IA (AITableJSONValidator.SCHEMA).
+
+ARCHIVO GENERADO por scripts/gen_ai_table_validator.py con
+fastjsonschema.compile_to_code; no editar a mano.
+"""
+'''
+
+# Según la versión importa solo JsonSchemaValueException o también JsonSchemaValuesException
+FASTJSONSCHEMA_IMPORT_RE = re.compile(r"^from fastjsonschema import [\w, ]+\n", re.MULTILINE)
+
+LOCAL_EXCEPTION = '''
+
+class JsonSchemaValueException(ValueError):
+    """Error de validación (mismos atributos que el de fastjsonschema)."""
+
+    def __init__(self, message, value=None, name=None, definition=None, rule=None):
+        super().__init__(message)
+        self.message = message
+        self.value = value
+        self.name = name
+        self.definition = definition
+        self.rule = rule
+'''
+
+
+def load_schema(path: Path) -> dict:
+    """Lee SCHEMA de AITableJSONValidator sin importar el módulo (que importa el generado)."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and node.name == "AITableJSONValidator":
+            for stmt in node.body:
+                if (isinstance(stmt, ast.Assign)
+                        and any(isinstance(t, ast.Name) and t.id == "SCHEMA" for t in stmt.targets)):
+                    return ast.literal_eval(stmt.value)
+    raise SystemExit(f"No se encontró AITableJSONValidator.SCHEMA en {path}")
+
+
+def render(schema: dict) -> str:
+    """Genera el código fuente del módulo."""
+    code = fastjsonschema.compile_to_code(schema)
+    code, replaced = FASTJSONSCHEMA_IMPORT_RE.subn(LOCAL_EXCEPTION, code, count=1)
+    if not replaced:
+        raise SystemExit("Formato de fastjsonschema.compile_to_code no reconocido")
+    if "JsonSchemaValuesException" in code:
+        raise SystemExit("El código generado usa JsonSchemaValuesException; no soportado")
+    return HEADER + code
+
+
+def main() -> int:
+    source = render(load_schema(VALIDATOR_FILE))
+
+    if "--check" in sys.argv[1:]:
+        current = OUTPUT_FILE.read_text(encoding="utf-8") if OUTPUT_FILE.exists() else ""
+        if current != source:
+            print(f"{OUTPUT_FILE.relative_to(ROOT)} está desactualizado; ejecuta scripts/gen_ai_table_validator.py")
+            return 1
+        return 0
+
+    OUTPUT_FILE.write_text(source, encoding="utf-8")
+    print(f"{OUTPUT_FILE.relative_to(ROOT)} generado")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Genera src/core/_sql_reserved.py a partir de scripts/sql_reserved_words.txt.
+
+Uso:
+    python scripts/gen_sql_keywords.py          # regenera el módulo
+    python scripts/gen_sql_keywords.py --check  # falla si el módulo está desactualizado
+"""
+
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+WORDS_FILE = ROOT / "scripts" / "sql_reserved_words.txt"
+OUTPUT_FILE = ROOT / "src" / "core" / "_sql_reserved.py"
+
+HEADER = '''"""
+Palabras reservadas SQL para validación de nombres de tabla.
+
+ARCHIVO GENERADO por scripts/gen_sql_keywords.py desde
+scripts/sql_reserved_words.txt; no editar a mano.
+"""
+'''
+
+
+def load_words(path: Path) -> list:
+    """Lee las palabras (una por línea, ignorando vacías y comentarios)."""
+    words = set()
+    for line in path.read_text(encoding="utf-8").splitlines():
+        word = line.strip()
+        if word and not word.startswith("#"):
+            words.add(word.upper())
+    return sorted(words)
+
+
+def render(words: list) -> str:
+    """Genera el código fuente del módulo."""
+    by_letter = defaultdict(list)
+    for word in words:
+        by_letter[word[0]].append(word)
+
+    lines = [HEADER, "RESERVED_NAMES = frozenset({"]
+    lines += [f"    {word!r}," for word in words]
+    lines.append("})")
+    lines.append("")
+    lines.append("# Palabras agrupadas por inicial: solo se consulta el grupo de la letra")
+    lines.append("RESERVED_BY_LETTER = {")
+    for letter in sorted(by_letter):
+        group = ", ".join(repr(word) for word in by_letter[letter])
+        lines.append(f"    {letter!r}: frozenset({{{group}}}),")
+    lines.append("}")
+    lines.append("")
+    lines.append("RESERVED_MAX_LENGTH = max(map(len, RESERVED_NAMES))")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    source = render(load_words(WORDS_FILE))
+
+    if "--check" in sys.argv[1:]:
+        current = OUTPUT_FILE.read_text(encoding="utf-8") if OUTPUT_FILE.exists() else ""
+        if current != source:
+            print(f"{OUTPUT_FILE.relative_to(ROOT)} está desactualizado; ejecuta scripts/gen_sql_keywords.py")
+            return 1
+        return 0
+
+    OUTPUT_FILE.write_text(source, encoding="utf-8")
+    print(f"{OUTPUT_FILE.relative_to(ROOT)} generado")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
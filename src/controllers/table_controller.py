@@ -3,15 +3,13 @@ Table Controller
 Gestiona la lógica de negocio de tablas de items
 """
 
-import sys
 import logging
-from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from PyQt6.QtCore import QObject, pyqtSignal
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from database.db_manager import DBManager
 from core.table_validator import TableValidator
+from models.ai_table_data import TableScan
 
 logger = logging.getLogger(__name__)
 
@@ -80,19 +78,21 @@ class TableController(QObject):
             logger.error(f"Error validating table name: {e}")
             return False, f"Error al validar nombre: {str(e)}"
 
-    def validate_table_data(self, table_data: List[List[str]], min_filled: int = 1) -> tuple:
+    def validate_table_data(self, table_data: List[List[str]], min_filled: int = 1,
+                            scan: Optional[TableScan] = None) -> tuple:
         """
         Valida que los datos de tabla tengan al menos N celdas llenas
 
         Args:
             table_data: Matriz de datos
             min_filled: Mínimo de celdas llenas requeridas
+            scan: Recorrido previo de table_data (opcional, evita recontar)
 
         Returns:
             Tuple (is_valid, error_message, filled_count)
         """
         # Usar TableValidator
-        return TableValidator.validate_table_data(table_data, min_filled)
+        return TableValidator.validate_table_data(table_data, min_filled, scan=scan)
 
     def sanitize_cell_content(self, content: str) -> str:
         """
@@ -111,7 +111,8 @@ class TableController(QObject):
 
     def create_table(self, category_id: int, table_name: str, table_data: List[List[str]],
                     column_names: List[str], tags: List[str] = None, sensitive_columns: List[int] = None,
-                    url_columns: List[int] = None) -> Dict[str, Any]:
+                    url_columns: List[int] = None, scan: Optional[TableScan] = None,
+                    progress_callback: Optional[Callable[[int, int], bool]] = None) -> Dict[str, Any]:
         """
         Crea todos los items de una tabla
 
@@ -141,6 +142,9 @@ class TableController(QObject):
             tags: Tags opcionales
             sensitive_columns: Índices de columnas sensibles (opcional)
             url_columns: Índices de columnas tipo URL (opcional)
+            scan: Recorrido previo de table_data (opcional, p. ej. AITableData.get_scan())
+            progress_callback: Callable(filas_hechas, filas_totales) para el progreso;
+                si retorna False se cancela la creación (ver DBManager.add_table_items)
 
         Returns:
             Dict con 'success', 'items_created', 'table_name', 'errors', 'filled_cells'
@@ -162,7 +166,9 @@ class TableController(QObject):
                 }
 
             # Validación 2: Datos de tabla
-            is_valid_data, error_msg, filled_count = self.validate_table_data(table_data, min_filled=1)
+            is_valid_data, error_msg, filled_count = self.validate_table_data(
+                table_data, min_filled=1, scan=scan
+            )
             if not is_valid_data:
                 logger.error(f"Invalid table data: {error_msg}")
                 self.error_occurred.emit(error_msg)
@@ -185,7 +191,8 @@ class TableController(QObject):
                 column_names=column_names,
                 tags=tags,
                 sensitive_columns=sensitive_columns,
-                url_columns=url_columns
+                url_columns=url_columns,
+                progress_callback=progress_callback
             )
 
             if result['success']:
@@ -257,15 +264,18 @@ class TableController(QObject):
                 'error': str(e)
             }
 
-    def update_table(self, table_name: str, table_data: List[List[str]],
-                    column_names: List[str] = None) -> Dict[str, Any]:
+    def update_table(self, table_name: str, table_data: List[List[str]] = None,
+                    column_names: List[str] = None,
+                    updates: List[tuple] = None) -> Dict[str, Any]:
         """
-        Actualiza todos los items de una tabla
+        Actualiza los items de una tabla
 
         Args:
             table_name: Nombre de la tabla
-            table_data: Nueva matriz de datos
+            table_data: Nueva matriz de datos (se actualizan todas las celdas)
             column_names: Nuevos nombres de columnas (opcional)
+            updates: Solo las celdas cambiadas, [(fila, columna, valor), ...];
+                si se indica, table_data se ignora
 
         Returns:
             Dict con resultado de operación
@@ -289,21 +299,27 @@ class TableController(QObject):
             updates_count = 0
             errors = []
 
-            for row_idx, row_data in enumerate(table_data):
-                for col_idx, cell_value in enumerate(row_data):
-                    sanitized_value = self.sanitize_cell_content(cell_value)
-
-                    success = self.db.update_table_cell(
-                        table_name=table_name,
-                        row=row_idx,
-                        col=col_idx,
-                        new_content=sanitized_value
-                    )
-
-                    if success:
-                        updates_count += 1
-                    else:
-                        errors.append(f"Error updating cell [{row_idx}, {col_idx}]")
+            if updates is None:
+                updates = (
+                    (row_idx, col_idx, cell_value)
+                    for row_idx, row_data in enumerate(table_data)
+                    for col_idx, cell_value in enumerate(row_data)
+                )
+
+            for row_idx, col_idx, cell_value in updates:
+                sanitized_value = self.sanitize_cell_content(cell_value)
+
+                success = self.db.update_table_cell(
+                    table_name=table_name,
+                    row=row_idx,
+                    col=col_idx,
+                    new_content=sanitized_value
+                )
+
+                if success:
+                    updates_count += 1
+                else:
+                    errors.append(f"Error updating cell [{row_idx}, {col_idx}]")
 
             # Obtener category_id de la tabla
             category_id = existing_items[0].get('category_id') if existing_items else None
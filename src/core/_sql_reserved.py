@@ -0,0 +1,268 @@
+"""
+Palabras reservadas SQL para validación de nombres de tabla.
+
+ARCHIVO GENERADO por scripts/gen_sql_keywords.py desde
+scripts/sql_reserved_words.txt; no editar a mano.
+"""
+
+RESERVED_NAMES = frozenset({
+    'ABSOLUTE',
+    'ACTION',
+    'ADD',
+    'ALL',
+    'ALLOCATE',
+    'ALTER',
+    'AND',
+    'ANY',
+    'ARE',
+    'AS',
+    'ASC',
+    'ASSERTION',
+    'AT',
+    'AUTHORIZATION',
+    'AVG',
+    'BEGIN',
+    'BETWEEN',
+    'BIT',
+    'BIT_LENGTH',
+    'BOTH',
+    'BY',
+    'CASCADE',
+    'CASCADED',
+    'CASE',
+    'CAST',
+    'CATALOG',
+    'CHAR',
+    'CHARACTER',
+    'CHARACTER_LENGTH',
+    'CHAR_LENGTH',
+    'CHECK',
+    'CLOSE',
+    'COALESCE',
+    'COLLATE',
+    'COLLATION',
+    'COLUMN',
+    'COMMIT',
+    'CONNECT',
+    'CONNECTION',
+    'CONSTRAINT',
+    'CONSTRAINTS',
+    'CONTINUE',
+    'CONVERT',
+    'CORRESPONDING',
+    'COUNT',
+    'CREATE',
+    'CROSS',
+    'CURRENT',
+    'CURRENT_DATE',
+    'CURRENT_TIME',
+    'CURRENT_TIMESTAMP',
+    'CURRENT_USER',
+    'CURSOR',
+    'DATABASE',
+    'DATE',
+    'DAY',
+    'DEALLOCATE',
+    'DEC',
+    'DECIMAL',
+    'DECLARE',
+    'DEFAULT',
+    'DEFERRABLE',
+    'DEFERRED',
+    'DELETE',
+    'DESC',
+    'DESCRIBE',
+    'DESCRIPTOR',
+    'DIAGNOSTICS',
+    'DISCONNECT',
+    'DISTINCT',
+    'DOMAIN',
+    'DOUBLE',
+    'DROP',
+    'ELSE',
+    'END',
+    'END-EXEC',
+    'ESCAPE',
+    'EXCEPT',
+    'EXCEPTION',
+    'EXEC',
+    'EXECUTE',
+    'EXISTS',
+    'EXTERNAL',
+    'EXTRACT',
+    'FALSE',
+    'FETCH',
+    'FIRST',
+    'FLOAT',
+    'FOR',
+    'FOREIGN',
+    'FOUND',
+    'FROM',
+    'FULL',
+    'GET',
+    'GLOBAL',
+    'GO',
+    'GOTO',
+    'GRANT',
+    'GROUP',
+    'HAVING',
+    'HOUR',
+    'IDENTITY',
+    'IMMEDIATE',
+    'IN',
+    'INDEX',
+    'INDICATOR',
+    'INITIALLY',
+    'INNER',
+    'INPUT',
+    'INSENSITIVE',
+    'INSERT',
+    'INT',
+    'INTEGER',
+    'INTERSECT',
+    'INTERVAL',
+    'INTO',
+    'IS',
+    'ISOLATION',
+    'JOIN',
+    'KEY',
+    'LANGUAGE',
+    'LAST',
+    'LEADING',
+    'LEFT',
+    'LEVEL',
+    'LIKE',
+    'LOCAL',
+    'LOWER',
+    'MATCH',
+    'MAX',
+    'MIN',
+    'MINUTE',
+    'MODULE',
+    'MONTH',
+    'NAMES',
+    'NATIONAL',
+    'NATURAL',
+    'NCHAR',
+    'NEXT',
+    'NO',
+    'NOT',
+    'NULL',
+    'NULLIF',
+    'NUMERIC',
+    'OCTET_LENGTH',
+    'OF',
+    'ON',
+    'ONLY',
+    'OPEN',
+    'OPTION',
+    'OR',
+    'ORDER',
+    'OUTER',
+    'OUTPUT',
+    'OVERLAPS',
+    'PAD',
+    'PARTIAL',
+    'POSITION',
+    'PRECISION',
+    'PREPARE',
+    'PRESERVE',
+    'PRIMARY',
+    'PRIOR',
+    'PRIVILEGES',
+    'PROCEDURE',
+    'PUBLIC',
+    'READ',
+    'REAL',
+    'REFERENCES',
+    'RELATIVE',
+    'RESTRICT',
+    'REVOKE',
+    'RIGHT',
+    'ROLLBACK',
+    'ROWS',
+    'SCHEMA',
+    'SCROLL',
+    'SECOND',
+    'SECTION',
+    'SELECT',
+    'SESSION',
+    'SESSION_USER',
+    'SET',
+    'SIZE',
+    'SMALLINT',
+    'SOME',
+    'SPACE',
+    'SQL',
+    'SQLCODE',
+    'SQLERROR',
+    'SQLSTATE',
+    'SUBSTRING',
+    'SUM',
+    'SYSTEM_USER',
+    'TABLE',
+    'TEMPORARY',
+    'THEN',
+    'TIME',
+    'TIMESTAMP',
+    'TIMEZONE_HOUR',
+    'TIMEZONE_MINUTE',
+    'TO',
+    'TRAILING',
+    'TRANSACTION',
+    'TRANSLATE',
+    'TRANSLATION',
+    'TRIM',
+    'TRUE',
+    'UNION',
+    'UNIQUE',
+    'UNKNOWN',
+    'UPDATE',
+    'UPPER',
+    'USAGE',
+    'USER',
+    'USING',
+    'VALUE',
+    'VALUES',
+    'VARCHAR',
+    'VARYING',
+    'VIEW',
+    'WHEN',
+    'WHENEVER',
+    'WHERE',
+    'WITH',
+    'WORK',
+    'WRITE',
+    'YEAR',
+    'ZONE',
+})
+
+# Palabras agrupadas por inicial: solo se consulta el grupo de la letra
+RESERVED_BY_LETTER = {
+    'A': frozenset({'ABSOLUTE', 'ACTION', 'ADD', 'ALL', 'ALLOCATE', 'ALTER', 'AND', 'ANY', 'ARE', 'AS', 'ASC', 'ASSERTION', 'AT', 'AUTHORIZATION', 'AVG'}),
+    'B': frozenset({'BEGIN', 'BETWEEN', 'BIT', 'BIT_LENGTH', 'BOTH', 'BY'}),
+    'C': frozenset({'CASCADE', 'CASCADED', 'CASE', 'CAST', 'CATALOG', 'CHAR', 'CHARACTER', 'CHARACTER_LENGTH', 'CHAR_LENGTH', 'CHECK', 'CLOSE', 'COALESCE', 'COLLATE', 'COLLATION', 'COLUMN', 'COMMIT', 'CONNECT', 'CONNECTION', 'CONSTRAINT', 'CONSTRAINTS', 'CONTINUE', 'CONVERT', 'CORRESPONDING', 'COUNT', 'CREATE', 'CROSS', 'CURRENT', 'CURRENT_DATE', 'CURRENT_TIME', 'CURRENT_TIMESTAMP', 'CURRENT_USER', 'CURSOR'}),
+    'D': frozenset({'DATABASE', 'DATE', 'DAY', 'DEALLOCATE', 'DEC', 'DECIMAL', 'DECLARE', 'DEFAULT', 'DEFERRABLE', 'DEFERRED', 'DELETE', 'DESC', 'DESCRIBE', 'DESCRIPTOR', 'DIAGNOSTICS', 'DISCONNECT', 'DISTINCT', 'DOMAIN', 'DOUBLE', 'DROP'}),
+    'E': frozenset({'ELSE', 'END', 'END-EXEC', 'ESCAPE', 'EXCEPT', 'EXCEPTION', 'EXEC', 'EXECUTE', 'EXISTS', 'EXTERNAL', 'EXTRACT'}),
+    'F': frozenset({'FALSE', 'FETCH', 'FIRST', 'FLOAT', 'FOR', 'FOREIGN', 'FOUND', 'FROM', 'FULL'}),
+    'G': frozenset({'GET', 'GLOBAL', 'GO', 'GOTO', 'GRANT', 'GROUP'}),
+    'H': frozenset({'HAVING', 'HOUR'}),
+    'I': frozenset({'IDENTITY', 'IMMEDIATE', 'IN', 'INDEX', 'INDICATOR', 'INITIALLY', 'INNER', 'INPUT', 'INSENSITIVE', 'INSERT', 'INT', 'INTEGER', 'INTERSECT', 'INTERVAL', 'INTO', 'IS', 'ISOLATION'}),
+    'J': frozenset({'JOIN'}),
+    'K': frozenset({'KEY'}),
+    'L': frozenset({'LANGUAGE', 'LAST', 'LEADING', 'LEFT', 'LEVEL', 'LIKE', 'LOCAL', 'LOWER'}),
+    'M': frozenset({'MATCH', 'MAX', 'MIN', 'MINUTE', 'MODULE', 'MONTH'}),
+    'N': frozenset({'NAMES', 'NATIONAL', 'NATURAL', 'NCHAR', 'NEXT', 'NO', 'NOT', 'NULL', 'NULLIF', 'NUMERIC'}),
+    'O': frozenset({'OCTET_LENGTH', 'OF', 'ON', 'ONLY', 'OPEN', 'OPTION', 'OR', 'ORDER', 'OUTER', 'OUTPUT', 'OVERLAPS'}),
+    'P': frozenset({'PAD', 'PARTIAL', 'POSITION', 'PRECISION', 'PREPARE', 'PRESERVE', 'PRIMARY', 'PRIOR', 'PRIVILEGES', 'PROCEDURE', 'PUBLIC'}),
+    'R': frozenset({'READ', 'REAL', 'REFERENCES', 'RELATIVE', 'RESTRICT', 'REVOKE', 'RIGHT', 'ROLLBACK', 'ROWS'}),
+    'S': frozenset({'SCHEMA', 'SCROLL', 'SECOND', 'SECTION', 'SELECT', 'SESSION', 'SESSION_USER', 'SET', 'SIZE', 'SMALLINT', 'SOME', 'SPACE', 'SQL', 'SQLCODE', 'SQLERROR', 'SQLSTATE', 'SUBSTRING', 'SUM', 'SYSTEM_USER'}),
+    'T': frozenset({'TABLE', 'TEMPORARY', 'THEN', 'TIME', 'TIMESTAMP', 'TIMEZONE_HOUR', 'TIMEZONE_MINUTE', 'TO', 'TRAILING', 'TRANSACTION', 'TRANSLATE', 'TRANSLATION', 'TRIM', 'TRUE'}),
+    'U': frozenset({'UNION', 'UNIQUE', 'UNKNOWN', 'UPDATE', 'UPPER', 'USAGE', 'USER', 'USING'}),
+    'V': frozenset({'VALUE', 'VALUES', 'VARCHAR', 'VARYING', 'VIEW'}),
+    'W': frozenset({'WHEN', 'WHENEVER', 'WHERE', 'WITH', 'WORK', 'WRITE'}),
+    'Y': frozenset({'YEAR'}),
+    'Z': frozenset({'ZONE'}),
+}
+
+RESERVED_MAX_LENGTH = max(map(len, RESERVED_NAMES))
@@ -10,11 +10,19 @@ Este módulo coordina todo el proceso de creación de tablas mediante IA:
 """
 import json
 import logging
-from typing import List, Dict, Any, Tuple
-import sys
-from pathlib import Path
+from typing import List, Dict, Any, Tuple, Callable, TYPE_CHECKING
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
 
 from models.ai_table_data import (
     AITableData, TableConfigData, TableStructureData,
@@ -22,12 +30,17 @@ from models.ai_table_data import (
 )
 from utils.ai_table_prompt_templates import AITablePromptTemplate
 from utils.ai_table_json_validator import AITableJSONValidator
-from utils.column_type_detector import ColumnTypeDetector
-from controllers.table_controller import TableController
-from database.db_manager import DBManager
+
+if TYPE_CHECKING:
+    from controllers.table_controller import TableController
+    from database.db_manager import DBManager
+    from utils.column_type_detector import ColumnTypeDetector
 
 logger = logging.getLogger(__name__)
 
+# Errores de tipos/campos que lanza msgspec al decodificar
+_STRUCTURE_ERRORS = (msgspec.ValidationError,) if MSGSPEC_AVAILABLE else ()
+
 
 class AITableManager:
     """
@@ -40,7 +53,7 @@ class AITableManager:
     4. Creación en base de datos
     """
 
-    def __init__(self, db_manager: DBManager):
+    def __init__(self, db_manager: 'DBManager'):
         """
         Inicializa el manager.
 
@@ -48,12 +61,30 @@ class AITableManager:
             db_manager: Instancia de DBManager para acceso a BD
         """
         self.db = db_manager
-        self.table_controller = TableController(db_manager)
         self.validator = AITableJSONValidator()
-        self.detector = ColumnTypeDetector()
+
+        # Se crean al primer uso: TableController arrastra PyQt6 y la capa de BD
+        self._table_controller = None
+        self._detector = None
 
         logger.info("AITableManager initialized")
 
+    @property
+    def table_controller(self) -> 'TableController':
+        """TableController usado para crear tablas (importado al primer uso)."""
+        if self._table_controller is None:
+            from controllers.table_controller import TableController
+            self._table_controller = TableController(self.db)
+        return self._table_controller
+
+    @property
+    def detector(self) -> 'ColumnTypeDetector':
+        """Detector de tipos de columna (importado al primer uso)."""
+        if self._detector is None:
+            from utils.column_type_detector import ColumnTypeDetector
+            self._detector = ColumnTypeDetector()
+        return self._detector
+
     # ========== GENERACIÓN DE PROMPTS ==========
 
     def generate_prompt(self, config: AITablePromptConfig) -> str:
@@ -76,7 +107,7 @@ class AITableManager:
             ... )
             >>> prompt = manager.generate_prompt(config)
         """
-        config_dict = {
+        prompt = AITablePromptTemplate.generate({
             'table_name': config.table_name,
             'category_id': config.category_id,
             'category_name': config.category_name,
@@ -85,9 +116,8 @@ class AITableManager:
             'tags': config.tags,
             'auto_detect_sensitive': config.auto_detect_sensitive,
             'auto_detect_urls': config.auto_detect_urls
-        }
+        })
 
-        prompt = AITablePromptTemplate.generate(config_dict)
         logger.info(
             f"Generated prompt for table '{config.table_name}' "
             f"({config.expected_rows} rows expected)"
@@ -146,47 +176,17 @@ class AITableManager:
         errors = []
 
         try:
-            # Parse JSON
-            data = json.loads(json_str)
+            if MSGSPEC_AVAILABLE:
+                # Decodifica y valida tipos directamente sobre las dataclasses en una sola pasada
+                ai_table = msgspec.json.decode(json_str, type=AITableData)
+            else:
+                ai_table = self._build_ai_table(json_str)
             logger.debug("JSON parsed successfully")
 
-            # Parsear table_config
-            config_dict = data['table_config']
-            table_config = TableConfigData(
-                table_name=config_dict['table_name'],
-                category_id=config_dict['category_id'],
-                tags=config_dict.get('tags', []),
-                auto_detect_sensitive=config_dict.get('auto_detect_sensitive', True),
-                auto_detect_urls=config_dict.get('auto_detect_urls', True)
-            )
-
-            # Parsear columns
-            columns = []
-            for col_dict in data['table_structure']['columns']:
-                column = TableColumnConfig(
-                    name=col_dict['name'],
-                    type=col_dict.get('type', 'TEXT'),
-                    is_sensitive=col_dict.get('is_sensitive', False),
-                    description=col_dict.get('description')
-                )
-                columns.append(column)
-
-            table_structure = TableStructureData(columns=columns)
-
-            # Parsear table_data
-            table_data = data['table_data']
-
             # NOTA: Auto-detección eliminada - ahora se usa configuración manual de columnas
             # Los tipos de columna (URL, sensible) vienen definidos en el JSON
             logger.info("Using manual column configuration (auto-detection disabled)")
 
-            # Crear objeto completo
-            ai_table = AITableData(
-                table_config=table_config,
-                table_structure=table_structure,
-                table_data=table_data
-            )
-
             # Validar consistencia de datos
             is_consistent, consistency_errors = ai_table.validate_data_consistency()
             if not is_consistent:
@@ -208,15 +208,73 @@ class AITableManager:
             errors.append(error_msg)
             return None, errors
 
+        except _STRUCTURE_ERRORS as e:
+            error_msg = f"Estructura inválida: {str(e)}"
+            logger.error(f"Parse error - invalid structure: {e}")
+            errors.append(error_msg)
+            return None, errors
+
         except Exception as e:
             error_msg = f"Error al parsear JSON: {str(e)}"
             logger.error(f"Parse error: {e}", exc_info=True)
             errors.append(error_msg)
             return None, errors
 
+    def _build_ai_table(self, json_str: str) -> AITableData:
+        """
+        Construye AITableData a partir del JSON sin msgspec.
+
+        Args:
+            json_str: String JSON válido
+
+        Returns:
+            AITableData construido campo a campo
+
+        Raises:
+            KeyError: Si falta un campo requerido
+        """
+        # Parse JSON (orjson si está disponible, es varias veces más rápido)
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(json_str)
+        else:
+            data = json.loads(json_str)
+
+        return AITableData(
+            table_config=self._build_table_config(data['table_config']),
+            table_structure=self._build_table_structure(data['table_structure']),
+            table_data=data['table_data']
+        )
+
+    @staticmethod
+    def _build_table_config(config_dict: Dict[str, Any]) -> TableConfigData:
+        """Construye TableConfigData desde su dict JSON (KeyError si falta un campo)."""
+        return TableConfigData(
+            table_name=config_dict['table_name'],
+            category_id=config_dict['category_id'],
+            tags=config_dict.get('tags', []),
+            auto_detect_sensitive=config_dict.get('auto_detect_sensitive', True),
+            auto_detect_urls=config_dict.get('auto_detect_urls', True)
+        )
+
+    @staticmethod
+    def _build_table_structure(structure_dict: Dict[str, Any]) -> TableStructureData:
+        """Construye TableStructureData desde su dict JSON (KeyError si falta un campo)."""
+        columns = []
+        for col_dict in structure_dict['columns']:
+            column = TableColumnConfig(
+                name=col_dict['name'],
+                type=col_dict.get('type', 'TEXT'),
+                is_sensitive=col_dict.get('is_sensitive', False),
+                description=col_dict.get('description')
+            )
+            columns.append(column)
+
+        return TableStructureData(columns=columns)
+
     # ========== CREACIÓN EN BASE DE DATOS ==========
 
-    def create_table_from_ai(self, ai_table: AITableData) -> Dict[str, Any]:
+    def create_table_from_ai(self, ai_table: AITableData,
+                             progress_callback: Callable[[int, int], bool] = None) -> Dict[str, Any]:
         """
         Crea tabla en BD desde objeto AITableData.
 
@@ -228,6 +286,8 @@ class AITableManager:
 
         Args:
             ai_table: Objeto con datos completos de tabla
+            progress_callback: Callable(filas_hechas, filas_totales) opcional;
+                si retorna False se cancela la creación
 
         Returns:
             Dict con resultado:
@@ -268,7 +328,9 @@ class AITableManager:
                 column_names=column_names,
                 tags=ai_table.table_config.tags,
                 sensitive_columns=sensitive_columns,
-                url_columns=url_columns
+                url_columns=url_columns,
+                scan=ai_table.get_scan(),
+                progress_callback=progress_callback
             )
 
             # Agregar información adicional al resultado
@@ -305,7 +367,7 @@ class AITableManager:
         Returns:
             String con JSON formateado
         """
-        return AITablePromptTemplate.get_example_json()
+        return AITablePromptTemplate.generate_schema_only()
 
     def get_validation_summary(self, result: TableValidationResult) -> str:
         """
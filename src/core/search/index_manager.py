@@ -5,12 +5,89 @@ Handles creation and maintenance of traditional SQL indexes
 to complement FTS5 search performance.
 """
 
+import re
 import sqlite3
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Indexes replaced by newer definitions, dropped before creating the current ones
+_LEGACY_INDEXES = (
+    # Functional LOWER() indexes superseded by the NOCASE-collated ones
+    "idx_items_label_lower",
+    "idx_categories_name_lower",
+    # Full-table indexes superseded by partial/covering ones
+    "idx_items_state_search",
+    "idx_items_usage_search",
+)
+
+# Extracts the index name from a CREATE INDEX statement
+_INDEX_NAME_RE = re.compile(r"INDEX\s+IF\s+NOT\s+EXISTS\s+(\w+)", re.IGNORECASE)
+
+# Whitespace runs and the IF NOT EXISTS clause, ignored when comparing index definitions
+_WHITESPACE_RE = re.compile(r"\s+")
+_IF_NOT_EXISTS_RE = re.compile(r"\s+IF\s+NOT\s+EXISTS\b", re.IGNORECASE)
+
+# Target definitions of the search indexes
+_SEARCH_INDEXES_SQL = [
+    # Label search (case-insensitive without calling LOWER() per row)
+    """
+    CREATE INDEX IF NOT EXISTS idx_items_label_nocase
+    ON items(label COLLATE NOCASE)
+    """,
+
+    # Tags search
+    """
+    CREATE INDEX IF NOT EXISTS idx_items_tags
+    ON items(tags)
+    """,
+
+    # Composite index for common filters
+    """
+    CREATE INDEX IF NOT EXISTS idx_items_search_composite
+    ON items(category_id, is_active, is_favorite)
+    """,
+
+    # Usage-based ordering (covering: label/category read from the index)
+    """
+    CREATE INDEX IF NOT EXISTS idx_items_usage_covering_search
+    ON items(use_count DESC, last_used DESC, label, category_id)
+    """,
+
+    # Date-based ordering
+    """
+    CREATE INDEX IF NOT EXISTS idx_items_dates_search
+    ON items(created_at DESC)
+    """,
+
+    # Type filtering
+    """
+    CREATE INDEX IF NOT EXISTS idx_items_type_search
+    ON items(type)
+    """,
+
+    # Active items only (partial: archived/inactive rows are not indexed)
+    """
+    CREATE INDEX IF NOT EXISTS idx_items_active_search
+    ON items(category_id, last_used DESC)
+    WHERE is_active = 1 AND is_archived = 0
+    """,
+
+    # Favorite items ordering (partial: favorites are a small minority)
+    """
+    CREATE INDEX IF NOT EXISTS idx_items_favorite_order
+    ON items(favorite_order)
+    WHERE is_favorite = 1
+    """,
+
+    # Category name for search
+    """
+    CREATE INDEX IF NOT EXISTS idx_categories_name_nocase
+    ON categories(name COLLATE NOCASE)
+    """,
+]
+
 
 class IndexManager:
     """Manager for B-Tree indexes"""
@@ -24,85 +101,76 @@ class IndexManager:
         """
         self.db = db_manager
 
+        # Cursor reused by every maintenance method (see _get_cursor)
+        self._cursor = None
+        self._cursor_connection = None
+
+    def _get_cursor(self) -> sqlite3.Cursor:
+        """
+        Get the shared cursor, recreating it if the connection changed
+
+        Returns:
+            Cursor bound to the current database connection
+        """
+        conn = self.db.connection
+        if self._cursor is None or self._cursor_connection is not conn:
+            self._cursor = conn.cursor()
+            self._cursor_connection = conn
+        return self._cursor
+
     def create_all_indexes(self):
         """
         Create all search-related B-Tree indexes
 
         Indexes created:
-        - Label search (case-insensitive)
+        - Label search (case-insensitive, NOCASE collation)
         - Tags search
         - Composite indexes for filtering
-        - Usage/frequency indexes
+        - Partial indexes for active and favorite items
+        - Usage/frequency indexes (covering)
         - Date indexes
         - Type indexes
         """
-        indexes_sql = [
-            # Label search (case-insensitive)
-            """
-            CREATE INDEX IF NOT EXISTS idx_items_label_lower
-            ON items(LOWER(label))
-            """,
-
-            # Tags search
-            """
-            CREATE INDEX IF NOT EXISTS idx_items_tags
-            ON items(tags)
-            """,
-
-            # Composite index for common filters
-            """
-            CREATE INDEX IF NOT EXISTS idx_items_search_composite
-            ON items(category_id, is_active, is_favorite)
-            """,
-
-            # Usage-based ordering
-            """
-            CREATE INDEX IF NOT EXISTS idx_items_usage_search
-            ON items(use_count DESC, last_used DESC)
-            """,
-
-            # Date-based ordering
-            """
-            CREATE INDEX IF NOT EXISTS idx_items_dates_search
-            ON items(created_at DESC)
-            """,
-
-            # Type filtering
-            """
-            CREATE INDEX IF NOT EXISTS idx_items_type_search
-            ON items(type)
-            """,
-
-            # State filtering
-            """
-            CREATE INDEX IF NOT EXISTS idx_items_state_search
-            ON items(is_active, is_archived)
-            """,
-
-            # Favorite items
-            """
-            CREATE INDEX IF NOT EXISTS idx_items_favorite
-            ON items(is_favorite, favorite_order)
-            """,
-
-            # Category name for search
-            """
-            CREATE INDEX IF NOT EXISTS idx_categories_name_lower
-            ON categories(LOWER(name))
-            """,
-        ]
-
-        cursor = self.db.connection.cursor()
-
-        created_count = 0
-        for index_sql in indexes_sql:
+        indexes_sql = _SEARCH_INDEXES_SQL
+
+        conn = self.db.connection
+        cursor = self._get_cursor()
+
+        # DDL only: fsync can be relaxed while the indexes are built
+        cursor.execute("PRAGMA synchronous")
+        previous_synchronous = cursor.fetchone()[0]
+        cursor.execute("PRAGMA synchronous = OFF")
+
+        try:
+            # Single script inside one transaction: one schema lock instead of one per index.
+            # ANALYZE items so the planner picks the partial/covering indexes; PRAGMA optimize
+            # covers the remaining tables (replaces a separate analyze_performance() call)
+            statements = [f"DROP INDEX IF EXISTS {name}" for name in _LEGACY_INDEXES] + indexes_sql
+            script = ";\n".join(statement.strip() for statement in statements)
             try:
-                cursor.execute(index_sql)
-                created_count += 1
+                conn.executescript(f"BEGIN IMMEDIATE;\n{script};\nCOMMIT;\nANALYZE items;\nPRAGMA optimize;")
             except sqlite3.OperationalError as e:
-                logger.warning(f"Index creation skipped: {e}")
-
-        self.db.connection.commit()
+                # Fall back to one statement at a time so a single bad index doesn't block the rest
+                logger.warning(f"Batch index creation failed ({e}), creating indexes one by one")
+                if conn.in_transaction:
+                    conn.rollback()
+                for statement in statements:
+                    try:
+                        cursor.execute(statement)
+                    except sqlite3.OperationalError as e:
+                        logger.warning(f"Index creation skipped: {e}")
+                conn.commit()
+        finally:
+            cursor.execute(f"PRAGMA synchronous = {previous_synchronous}")
+
+        # Count what actually exists instead of counting inside the loop
+        index_names = [_INDEX_NAME_RE.search(index_sql).group(1) for index_sql in indexes_sql]
+        placeholders = ", ".join("?" for _ in index_names)
+        cursor.execute(
+            f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name IN ({placeholders})",
+            index_names
+        )
+        created_count = cursor.fetchone()[0]
 
         logger.info(f"Created/verified {created_count} B-Tree indexes for search")
 
@@ -115,7 +183,7 @@ class IndexManager:
         Runs ANALYZE command to update SQLite query planner statistics
         Should be run periodically (e.g., after bulk operations)
         """
-        cursor = self.db.connection.cursor()
+        cursor = self._get_cursor()
 
         try:
             cursor.execute("ANALYZE")
@@ -138,15 +206,15 @@ class IndexManager:
         Example:
             [
                 {
-                    'name': 'idx_items_label_lower',
+                    'name': 'idx_items_label_nocase',
                     'table': 'items',
                     'unique': False,
-                    'columns': ['LOWER(label)']
+                    'columns': ['label COLLATE NOCASE']
                 },
                 ...
             ]
         """
-        cursor = self.db.connection.cursor()
+        cursor = self._get_cursor()
 
         try:
             # Get all indexes
@@ -172,35 +240,46 @@ class IndexManager:
             logger.error(f"Failed to get index info: {e}")
             return []
 
-    def drop_all_search_indexes(self):
+    def drop_all_search_indexes(self, index_names: Optional[List[str]] = None):
         """
         Drop all search-related indexes
 
         WARNING: This will slow down searches until indexes are recreated
         Use only for maintenance or migration purposes
+
+        Args:
+            index_names: Names of the indexes to drop. If None, all
+                         idx_*search* indexes are looked up in sqlite_master
         """
-        cursor = self.db.connection.cursor()
+        conn = self.db.connection
 
-        # Get all search index names
-        cursor.execute("""
-            SELECT name
-            FROM sqlite_master
-            WHERE type = 'index'
-              AND name LIKE 'idx_%search%'
-        """)
+        if index_names is None:
+            # Get all search index names
+            cursor = self._get_cursor()
+            cursor.execute("""
+                SELECT name
+                FROM sqlite_master
+                WHERE type = 'index'
+                  AND name LIKE 'idx_%search%'
+            """)
+            index_names = [row[0] for row in cursor.fetchall()]
 
-        index_names = [row[0] for row in cursor.fetchall()]
+        if not index_names:
+            logger.info("Dropped 0 search indexes")
+            return 0
 
-        dropped_count = 0
-        for index_name in index_names:
-            try:
-                cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
-                dropped_count += 1
-                logger.info(f"Dropped index: {index_name}")
-            except Exception as e:
-                logger.error(f"Failed to drop index {index_name}: {e}")
+        # One script in one transaction instead of one execute per index
+        script = "".join(f"DROP INDEX IF EXISTS {index_name};\n" for index_name in index_names)
 
-        self.db.connection.commit()
+        try:
+            conn.executescript(f"BEGIN;\n{script}COMMIT;")
+            dropped_count = len(index_names)
+            logger.info(f"Dropped indexes: {', '.join(index_names)}")
+        except sqlite3.Error as e:
+            logger.error(f"Failed to drop search indexes: {e}")
+            if conn.in_transaction:
+                conn.rollback()
+            dropped_count = 0
 
         logger.info(f"Dropped {dropped_count} search indexes")
 
@@ -210,21 +289,76 @@ class IndexManager:
         """
         Rebuild all search indexes
 
-        Drops and recreates all indexes for maintenance
+        Indexes whose definition already matches the target are rebuilt in
+        place with REINDEX; only missing or outdated ones are dropped and
+        recreated. Obsolete idx_*search* indexes are dropped.
         """
         logger.info("Starting index rebuild...")
 
-        # Drop existing indexes
-        dropped = self.drop_all_search_indexes()
-        logger.info(f"Dropped {dropped} indexes")
+        conn = self.db.connection
+        cursor = self._get_cursor()
+
+        targets = {_INDEX_NAME_RE.search(index_sql).group(1): index_sql for index_sql in _SEARCH_INDEXES_SQL}
 
-        # Create indexes again
-        created = self.create_all_indexes()
-        logger.info(f"Created {created} indexes")
+        # Current definitions of the target indexes and of any other search index
+        placeholders = ", ".join("?" for _ in targets)
+        cursor.execute(f"""
+            SELECT name, sql
+            FROM sqlite_master
+            WHERE type = 'index'
+              AND (name IN ({placeholders}) OR name LIKE 'idx_%search%')
+        """, list(targets))
+        existing = {name: sql for name, sql in cursor.fetchall()}
+
+        statements = []
+        reindexed = 0
+        recreated = 0
+        for name, index_sql in targets.items():
+            current_sql = existing.get(name)
+            if current_sql and _normalize_index_sql(current_sql) == _normalize_index_sql(index_sql):
+                statements.append(f"REINDEX {name}")
+                reindexed += 1
+            else:
+                statements.append(f"DROP INDEX IF EXISTS {name}")
+                statements.append(index_sql.strip())
+                recreated += 1
+
+        # Obsolete idx_*search* indexes plus the legacy LOWER() indexes they replaced
+        obsolete = [name for name in existing if name not in targets]
+        statements += [f"DROP INDEX IF EXISTS {name}" for name in obsolete]
+        statements += [f"DROP INDEX IF EXISTS {name}" for name in _LEGACY_INDEXES if name not in targets]
+
+        # One script inside an explicit transaction: DDL doesn't open the implicit
+        # BEGIN of the sqlite3 module, so a failure must not leave indexes half-dropped
+        script = ";\n".join(statements)
+        try:
+            conn.executescript(f"BEGIN IMMEDIATE;\n{script};\nCOMMIT;")
+        except sqlite3.Error as e:
+            logger.error(f"Index rebuild failed: {e}")
+            if conn.in_transaction:
+                conn.rollback()
+            return False
+
+        logger.info(
+            f"Reindexed {reindexed}, recreated {recreated}, "
+            f"dropped {len(obsolete)} obsolete indexes"
+        )
 
         # Update statistics
         self.analyze_performance()
+        cursor.execute("PRAGMA optimize")
 
         logger.info("Index rebuild completed successfully")
 
         return True
+
+
+def _normalize_index_sql(index_sql: str) -> str:
+    """
+    Normalize a CREATE INDEX statement for comparison
+
+    sqlite_master stores the statement without IF NOT EXISTS and with its
+    original whitespace, so both are ignored.
+    """
+    index_sql = _IF_NOT_EXISTS_RE.sub("", index_sql)
+    return _WHITESPACE_RE.sub(" ", index_sql).strip()
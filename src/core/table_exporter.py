@@ -3,15 +3,26 @@ Table Exporter
 Utilidades para exportar tablas a diferentes formatos (CSV, JSON, Excel)
 """
 
-import csv
-import json
+import re
 import logging
+from itertools import zip_longest
 from pathlib import Path
-from typing import Dict, List, Any
-from datetime import datetime
+from typing import Dict, List, Any, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Tamaño del buffer de escritura para exportaciones
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Caracteres no permitidos en nombres de archivo (espacios incluidos)
+_UNSAFE_FILENAME_RE = re.compile(r'[ /\\:*?"<>|]+')
+
 
 class TableExporter:
     """
@@ -44,20 +55,22 @@ class TableExporter:
         Returns:
             bool: True si exportación exitosa
         """
+        import csv
+
         try:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            # Buffer de 1 MiB: menos escrituras al disco en exportaciones grandes
+            with open(output_file, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
                 writer = csv.writer(f, delimiter=delimiter)
 
                 # Escribir headers
                 if include_headers:
                     writer.writerow(column_names)
 
-                # Escribir datos
-                for row in table_data:
-                    writer.writerow(row)
+                # Escribir datos (writerows itera en C)
+                writer.writerows(table_data)
 
             logger.info(f"Table exported to CSV: {output_path}")
             return True
@@ -144,6 +157,7 @@ class TableExporter:
 
             # Agregar metadata
             if include_metadata:
+                from datetime import datetime
                 json_data["metadata"] = {
                     "exported_at": datetime.now().isoformat(),
                     "row_count": len(table_data),
@@ -151,11 +165,7 @@ class TableExporter:
                 }
 
             # Escribir archivo
-            with open(output_file, 'w', encoding='utf-8') as f:
-                if pretty:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(json_data, f, ensure_ascii=False)
+            TableExporter._write_json(output_file, json_data, pretty)
 
             logger.info(f"Table exported to JSON: {output_path}")
             return True
@@ -201,16 +211,15 @@ class TableExporter:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Convertir filas a registros (objetos)
-            records = []
-            for row in table_data:
-                record = {}
-                for col_idx, col_name in enumerate(column_names):
-                    if col_idx < len(row):
-                        record[col_name] = row[col_idx]
-                    else:
-                        record[col_name] = ""
-                records.append(record)
+            # Convertir filas a registros (objetos); las filas cortas se completan con ""
+            # (zip_longest) y las largas se truncan (zip). Tupla para compartir las claves
+            cols = tuple(column_names)
+            num_cols = len(cols)
+            records = [
+                dict(zip(cols, row)) if len(row) >= num_cols
+                else dict(zip_longest(cols, row, fillvalue=""))
+                for row in table_data
+            ]
 
             # Construir estructura JSON
             json_data = {
@@ -220,6 +229,7 @@ class TableExporter:
 
             # Agregar metadata
             if include_metadata:
+                from datetime import datetime
                 json_data["metadata"] = {
                     "exported_at": datetime.now().isoformat(),
                     "record_count": len(records),
@@ -227,11 +237,7 @@ class TableExporter:
                 }
 
             # Escribir archivo
-            with open(output_file, 'w', encoding='utf-8') as f:
-                if pretty:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(json_data, f, ensure_ascii=False)
+            TableExporter._write_json(output_file, json_data, pretty)
 
             logger.info(f"Table exported to JSON (records): {output_path}")
             return True
@@ -240,6 +246,30 @@ class TableExporter:
             logger.error(f"Error exporting to JSON records: {e}", exc_info=True)
             return False
 
+    @staticmethod
+    def _write_json(output_file: Path, json_data: Dict[str, Any], pretty: bool) -> None:
+        """
+        Escribe estructura JSON en disco.
+
+        Con orjson se escriben los bytes UTF-8 directamente, sin pasar por
+        un TextIOWrapper.
+
+        Args:
+            output_file: Ruta del archivo de salida
+            json_data: Estructura a serializar
+            pretty: Si formatear JSON con indentación
+        """
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(json_data, option=option))
+        else:
+            import json
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(json_data, f, indent=2 if pretty else None, ensure_ascii=False)
+
     @staticmethod
     def get_export_summary(
         table_name: str,
@@ -257,12 +287,10 @@ class TableExporter:
         Returns:
             Dict con estadísticas de la tabla
         """
-        # Contar celdas llenas
-        filled_cells = sum(1 for row in table_data for cell in row if cell and str(cell).strip())
         total_cells = len(table_data) * len(column_names)
 
-        # Calcular tamaño aproximado
-        total_chars = sum(len(str(cell)) for row in table_data for cell in row)
+        # Contar celdas llenas y tamaño aproximado
+        filled_cells, total_chars = TableExporter._summary_stats_python(table_data)
 
         return {
             "table_name": table_name,
@@ -275,6 +303,40 @@ class TableExporter:
             "estimated_size_kb": round(total_chars / 1024, 2)
         }
 
+    @staticmethod
+    def _summary_stats_python(table_data: List[List[str]]) -> Tuple[int, int]:
+        """
+        Cuenta celdas llenas y caracteres totales en una sola pasada.
+
+        Args:
+            table_data: Matriz de datos
+
+        Returns:
+            Tuple (filled_cells, total_chars)
+        """
+        filled_cells = 0
+        total_chars = 0
+        _isinstance = isinstance
+        _str = str
+        _len = len
+        _strip = str.strip
+        for row in table_data:
+            try:
+                # Filas de solo strings: strip/len por celda se ejecutan dentro de map (C)
+                filled_cells += sum(map(bool, map(_strip, row)))
+                total_chars += sum(map(_len, row))
+                continue
+            except TypeError:
+                # Hay celdas que no son str: recorrer la fila celda por celda
+                pass
+
+            for cell in row:
+                text = cell if _isinstance(cell, _str) else _str(cell)
+                total_chars += _len(text)
+                if cell and text.strip():
+                    filled_cells += 1
+        return filled_cells, total_chars
+
     @staticmethod
     def validate_export_data(
         table_data: List[List[str]],
@@ -299,11 +361,14 @@ class TableExporter:
             return False, "No hay nombres de columnas"
 
         # Validar que todas las filas tengan el mismo número de columnas
+        # Camino rápido en C (map + any con corto circuito); solo se recorre fila
+        # por fila para el diagnóstico cuando alguna fila no coincide
         expected_cols = len(column_names)
-        for row_idx, row in enumerate(table_data):
-            if len(row) != expected_cols:
-                logger.warning(f"Row {row_idx} has {len(row)} columns, expected {expected_cols}")
-                # No es error fatal, solo advertencia
+        if any(map(expected_cols.__ne__, map(len, table_data))):
+            for row_idx, row in enumerate(table_data):
+                if len(row) != expected_cols:
+                    logger.warning(f"Row {row_idx} has {len(row)} columns, expected {expected_cols}")
+                    # No es error fatal, solo advertencia
 
         return True, ""
 
@@ -319,6 +384,11 @@ class TableExporter:
         Returns:
             Nombre de archivo sugerido
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = table_name.replace(" ", "_").replace("/", "_").replace("\\", "_")
-        return f"{safe_name}_{timestamp}.{format.lower()}"
+        from datetime import datetime
+
+        # Una sola pasada con el patrón precompilado (y sin sustituir si no hace falta)
+        if _UNSAFE_FILENAME_RE.search(table_name) is None:
+            safe_name = table_name
+        else:
+            safe_name = _UNSAFE_FILENAME_RE.sub("_", table_name)
+        return f"{safe_name}_{datetime.now():%Y%m%d_%H%M%S}.{format.lower()}"
@@ -10,16 +10,41 @@ Proporciona métodos estáticos para validar:
 """
 
 import re
+import string
 import logging
-from typing import List, Tuple, Dict, Any, Optional
-from pathlib import Path
-import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AbstractSet, Iterable, List, Tuple, Dict, Any, Optional
 
-# Agregar path al sys.path para imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from core import _sql_reserved
+from core._sql_reserved import RESERVED_BY_LETTER, RESERVED_MAX_LENGTH
+from models.ai_table_data import TableScan, scan_table
 
 logger = logging.getLogger(__name__)
 
+# Patrón precompilado (evita la búsqueda en la caché de re en cada llamada)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Espacios que _WHITESPACE_RE cambiaría en texto ASCII (un ' ' aislado no cambia)
+_ASCII_WS_TO_COLLAPSE = ('  ', '\t', '\n', '\r', '\x0b', '\x0c', '\x1c', '\x1d', '\x1e', '\x1f')
+
+
+def _needs_whitespace_collapse(text: str) -> bool:
+    """Indica si _WHITESPACE_RE.sub(' ', text) modificaría el texto."""
+    if not text.isascii():
+        # Espacios Unicode (\xa0, \u2028...): dejar la decisión al regex
+        return True
+    return any(ws in text for ws in _ASCII_WS_TO_COLLAPSE)
+
+
+# Tabla de traducción que elimina los caracteres permitidos en nombres de tabla:
+# si tras translate() no queda nada, el nombre solo contiene caracteres válidos
+_TABLE_NAME_ALLOWED_CHARS = string.ascii_letters + string.digits + '_-'
+_DELETE_TABLE_NAME_CHARS = str.maketrans('', '', _TABLE_NAME_ALLOWED_CHARS)
+
+# Con más tablas existentes que esto no se memoriza (hashear la clave costaría más)
+_NAME_CACHE_MAX_EXISTING = 10_000
+
 
 class TableValidator:
     """
@@ -36,30 +61,25 @@ class TableValidator:
     MIN_COLS = 1
     MAX_COLS = 20
 
-    # Regex para nombre de tabla (mayúsculas, minúsculas, números, guiones y guiones bajos)
+    # Regex para nombre de tabla (mayúsculas, minúsculas, números, guiones y guiones bajos).
+    # Se conserva como referencia; la validación usa una tabla de str.translate
     TABLE_NAME_PATTERN = r'^[A-Za-z0-9_\-]+$'
 
-    # Nombres de tabla reservados (SQL keywords)
-    RESERVED_NAMES = {
-        'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'DROP', 'CREATE', 'ALTER',
-        'TABLE', 'INDEX', 'VIEW', 'DATABASE', 'FROM', 'WHERE', 'JOIN',
-        'INNER', 'OUTER', 'LEFT', 'RIGHT', 'ON', 'AS', 'AND', 'OR', 'NOT',
-        'NULL', 'IS', 'IN', 'BETWEEN', 'LIKE', 'ORDER', 'BY', 'GROUP',
-        'HAVING', 'DISTINCT', 'UNION', 'ALL', 'EXISTS', 'CASE', 'WHEN',
-        'THEN', 'ELSE', 'END', 'PRIMARY', 'KEY', 'FOREIGN', 'REFERENCES',
-        'CONSTRAINT', 'DEFAULT', 'CHECK', 'UNIQUE', 'COUNT', 'SUM', 'AVG',
-        'MIN', 'MAX'
-    }
+    # Nombres de tabla reservados (SQL keywords), generados en core/_sql_reserved.py
+    RESERVED_NAMES = _sql_reserved.RESERVED_NAMES
 
     @staticmethod
     def validate_table_name(
         name: str,
-        existing_tables: Optional[List[str]] = None,
+        existing_tables: Optional[Iterable[str]] = None,
         exclude_table: Optional[str] = None
     ) -> Tuple[bool, str]:
         """
         Valida que un nombre de tabla sea válido.
 
+        El resultado solo depende de los argumentos, así que se memoriza por
+        (nombre, tablas existentes, exclude_table); no requiere invalidación.
+
         Reglas:
         - No puede estar vacío
         - Máximo 100 caracteres
@@ -69,7 +89,8 @@ class TableValidator:
 
         Args:
             name: Nombre a validar
-            existing_tables: Lista opcional de nombres de tablas existentes
+            existing_tables: Nombres opcionales de tablas existentes (preferible un
+                set/frozenset; cualquier otro iterable se convierte a frozenset)
             exclude_table: Nombre a excluir de validación de unicidad (para edición)
 
         Returns:
@@ -82,16 +103,42 @@ class TableValidator:
         # Eliminar espacios
         name = name.strip()
 
+        # Unicidad con búsqueda O(1): convertir una sola vez en la frontera de la API
+        if existing_tables is None:
+            existing_tables = frozenset()
+        elif not isinstance(existing_tables, (set, frozenset)):
+            existing_tables = frozenset(existing_tables)
+
+        if len(existing_tables) > _NAME_CACHE_MAX_EXISTING:
+            return TableValidator._check_table_name(name, existing_tables, exclude_table)
+
+        # frozenset() de un frozenset devuelve el mismo objeto (sin copia)
+        return _check_table_name_cached(name, frozenset(existing_tables), exclude_table)
+
+    @staticmethod
+    def _check_table_name(
+        name: str,
+        existing_tables: AbstractSet[str],
+        exclude_table: Optional[str]
+    ) -> Tuple[bool, str]:
+        """Reglas de validate_table_name sobre un nombre ya recortado y no vacío."""
         # Validar longitud
         if len(name) > TableValidator.MAX_TABLE_NAME_LENGTH:
             return False, f"El nombre no puede exceder {TableValidator.MAX_TABLE_NAME_LENGTH} caracteres"
 
-        # Validar formato (mayúsculas, minúsculas, números, guiones, guiones bajos)
-        if not re.match(TableValidator.TABLE_NAME_PATTERN, name):
+        # Validar formato (mayúsculas, minúsculas, números, guiones, guiones bajos).
+        # isascii() es O(1) en CPython y descarta sin recorrer los nombres con
+        # caracteres no ASCII, que nunca son válidos
+        if not name.isascii() or name.translate(_DELETE_TABLE_NAME_CHARS):
             return False, "El nombre solo puede contener letras (mayúsculas o minúsculas), números, guiones (-) y guiones bajos (_)"
 
-        # Validar no sea palabra reservada
-        if name.upper() in TableValidator.RESERVED_NAMES:
+        # Validar no sea palabra reservada (descarte previo por longitud e inicial
+        # para no crear la copia en mayúsculas en la mayoría de nombres)
+        reserved_bucket = (
+            RESERVED_BY_LETTER.get(name[0].upper())
+            if len(name) <= RESERVED_MAX_LENGTH else None
+        )
+        if reserved_bucket and name.upper() in reserved_bucket:
             return False, f"'{name}' es una palabra reservada SQL y no puede usarse como nombre de tabla"
 
         # Validar unicidad (si se proporciona lista)
@@ -137,7 +184,8 @@ class TableValidator:
     @staticmethod
     def validate_table_data(
         table_data: List[List[str]],
-        min_filled: int = 1
+        min_filled: int = 1,
+        scan: Optional[TableScan] = None
     ) -> Tuple[bool, str, int]:
         """
         Valida que los datos de tabla tengan al menos N celdas llenas.
@@ -145,6 +193,7 @@ class TableValidator:
         Args:
             table_data: Matriz de datos (lista de listas)
             min_filled: Mínimo de celdas llenas requeridas
+            scan: Recorrido ya calculado con scan_table (se calcula si es None)
 
         Returns:
             Tuple (is_valid: bool, error_message: str, filled_count: int)
@@ -152,15 +201,13 @@ class TableValidator:
         if not table_data:
             return False, "Los datos de la tabla están vacíos", 0
 
-        # Contar celdas llenas
-        filled_count = 0
-        for row in table_data:
-            if not isinstance(row, list):
-                return False, "Formato de datos inválido (debe ser lista de listas)", 0
+        # Validar forma y contar celdas llenas (un solo recorrido)
+        if scan is None:
+            scan = scan_table(table_data)
+        if scan.any_non_list_row:
+            return False, "Formato de datos inválido (debe ser lista de listas)", 0
 
-            for cell in row:
-                if cell and str(cell).strip():
-                    filled_count += 1
+        filled_count = scan.filled_count
 
         # Validar mínimo de celdas llenas
         if filled_count < min_filled:
@@ -192,19 +239,23 @@ class TableValidator:
         if len(column_names) != num_cols:
             return False, f"Se esperaban {num_cols} nombres de columnas, se recibieron {len(column_names)}"
 
-        # Validar que no estén todos vacíos
-        non_empty = [name for name in column_names if name and name.strip()]
-        if not non_empty:
-            return False, "Debe proporcionar al menos un nombre de columna"
-
-        # Validar duplicados (solo entre los no vacíos)
+        # Validar duplicados (solo entre los no vacíos) y que no estén todos vacíos,
+        # en un solo recorrido
         seen = set()
         for name in column_names:
-            if name and name.strip():
-                name_upper = name.strip().upper()
-                if name_upper in seen:
-                    return False, f"Nombre de columna duplicado: '{name.strip()}'"
-                seen.add(name_upper)
+            if not name:
+                continue
+            stripped = name.strip()
+            if not stripped:
+                continue
+            # casefold(): comparación sin mayúsculas/minúsculas correcta en Unicode
+            name_key = stripped.casefold()
+            if name_key in seen:
+                return False, f"Nombre de columna duplicado: '{stripped}'"
+            seen.add(name_key)
+
+        if not seen:
+            return False, "Debe proporcionar al menos un nombre de columna"
 
         return True, ""
 
@@ -235,7 +286,9 @@ class TableValidator:
         content = content.strip()
 
         # Reemplazar múltiples espacios consecutivos por uno solo
-        content = re.sub(r'\s+', ' ', content)
+        # (la mayoría de celdas cortas no tienen nada que colapsar)
+        if _needs_whitespace_collapse(content):
+            content = _WHITESPACE_RE.sub(' ', content)
 
         # Limitar longitud
         if len(content) > TableValidator.MAX_CELL_LENGTH:
@@ -255,16 +308,39 @@ class TableValidator:
         Returns:
             Matriz de datos sanitizada
         """
-        sanitized = []
+        sanitize = TableValidator.sanitize_cell_content
+        return [list(map(sanitize, row)) for row in table_data]
+
+    @staticmethod
+    def _run_all_validations(
+        table_name: str,
+        rows: int,
+        cols: int,
+        column_names: List[str],
+        table_data: List[List[str]],
+        existing_tables: Optional[AbstractSet[str]] = None,
+        min_filled: int = 1
+    ) -> '_FullValidationResult':
+        """
+        Ejecuta una vez cada validación y reúne los resultados.
 
-        for row in table_data:
-            sanitized_row = []
-            for cell in row:
-                sanitized_cell = TableValidator.sanitize_cell_content(cell)
-                sanitized_row.append(sanitized_cell)
-            sanitized.append(sanitized_row)
+        Núcleo común de validate_complete_table_config y get_validation_summary.
 
-        return sanitized
+        Returns:
+            _FullValidationResult con el resultado de cada validación
+        """
+        name_ok, name_err = TableValidator.validate_table_name(table_name, existing_tables)
+        dims_ok, dims_err = TableValidator.validate_table_dimensions(rows, cols)
+        cols_ok, cols_err = TableValidator.validate_column_names(column_names, cols)
+        data_ok, data_err, filled_count = TableValidator.validate_table_data(table_data, min_filled)
+
+        return _FullValidationResult(
+            name_ok, name_err,
+            dims_ok, dims_err,
+            cols_ok, cols_err,
+            data_ok, data_err,
+            filled_count
+        )
 
     @staticmethod
     def validate_complete_table_config(
@@ -273,7 +349,7 @@ class TableValidator:
         cols: int,
         column_names: List[str],
         table_data: List[List[str]],
-        existing_tables: Optional[List[str]] = None,
+        existing_tables: Optional[AbstractSet[str]] = None,
         min_filled: int = 1
     ) -> Tuple[bool, List[str]]:
         """
@@ -287,43 +363,29 @@ class TableValidator:
             cols: Número de columnas
             column_names: Lista de nombres de columnas
             table_data: Matriz de datos
-            existing_tables: Lista opcional de tablas existentes
+            existing_tables: Conjunto opcional de tablas existentes (set/frozenset)
             min_filled: Mínimo de celdas llenas
 
         Returns:
             Tuple (is_valid: bool, errors: List[str])
         """
-        errors = []
-
-        # Validar nombre
-        is_valid_name, error_msg = TableValidator.validate_table_name(
-            table_name,
-            existing_tables
-        )
-        if not is_valid_name:
-            errors.append(f"Nombre: {error_msg}")
-
-        # Validar dimensiones
-        is_valid_dims, error_msg = TableValidator.validate_table_dimensions(rows, cols)
-        if not is_valid_dims:
-            errors.append(f"Dimensiones: {error_msg}")
-
-        # Validar nombres de columnas
-        is_valid_cols, error_msg = TableValidator.validate_column_names(column_names, cols)
-        if not is_valid_cols:
-            errors.append(f"Columnas: {error_msg}")
-
-        # Validar datos
-        is_valid_data, error_msg, filled_count = TableValidator.validate_table_data(
-            table_data,
-            min_filled
+        result = TableValidator._run_all_validations(
+            table_name, rows, cols, column_names, table_data,
+            existing_tables, min_filled
         )
-        if not is_valid_data:
-            errors.append(f"Datos: {error_msg}")
 
-        # Retornar resultado
-        is_valid = len(errors) == 0
-        return is_valid, errors
+        errors = [
+            f"{label}: {error_msg}"
+            for label, is_valid, error_msg in (
+                ("Nombre", result.name_ok, result.name_err),
+                ("Dimensiones", result.dims_ok, result.dims_err),
+                ("Columnas", result.cols_ok, result.cols_err),
+                ("Datos", result.data_ok, result.data_err),
+            )
+            if not is_valid
+        ]
+
+        return len(errors) == 0, errors
 
     @staticmethod
     def get_validation_summary(
@@ -348,45 +410,48 @@ class TableValidator:
         Returns:
             Dict con resultados de cada validación
         """
-        summary = {
-            'name': {'valid': True, 'errors': []},
-            'dimensions': {'valid': True, 'errors': []},
-            'columns': {'valid': True, 'errors': []},
-            'data': {'valid': True, 'errors': [], 'filled_count': 0},
-            'overall_valid': False
-        }
+        result = TableValidator._run_all_validations(
+            table_name, rows, cols, column_names, table_data
+        )
 
-        # Validar nombre
-        is_valid, error_msg = TableValidator.validate_table_name(table_name)
-        summary['name']['valid'] = is_valid
-        if not is_valid:
-            summary['name']['errors'].append(error_msg)
+        def section(is_valid: bool, error_msg: str) -> Dict[str, Any]:
+            return {'valid': is_valid, 'errors': [] if is_valid else [error_msg]}
 
-        # Validar dimensiones
-        is_valid, error_msg = TableValidator.validate_table_dimensions(rows, cols)
-        summary['dimensions']['valid'] = is_valid
-        if not is_valid:
-            summary['dimensions']['errors'].append(error_msg)
+        data_section = section(result.data_ok, result.data_err)
+        data_section['filled_count'] = result.filled_count
+
+        return {
+            'name': section(result.name_ok, result.name_err),
+            'dimensions': section(result.dims_ok, result.dims_err),
+            'columns': section(result.cols_ok, result.cols_err),
+            'data': data_section,
+            'overall_valid': result.is_valid
+        }
 
-        # Validar columnas
-        is_valid, error_msg = TableValidator.validate_column_names(column_names, cols)
-        summary['columns']['valid'] = is_valid
-        if not is_valid:
-            summary['columns']['errors'].append(error_msg)
-
-        # Validar datos
-        is_valid, error_msg, filled_count = TableValidator.validate_table_data(table_data)
-        summary['data']['valid'] = is_valid
-        summary['data']['filled_count'] = filled_count
-        if not is_valid:
-            summary['data']['errors'].append(error_msg)
-
-        # Validación general
-        summary['overall_valid'] = (
-            summary['name']['valid'] and
-            summary['dimensions']['valid'] and
-            summary['columns']['valid'] and
-            summary['data']['valid']
-        )
 
-        return summary
+@dataclass
+class _FullValidationResult:
+    """Resultado de cada validación de TableValidator._run_all_validations."""
+    name_ok: bool
+    name_err: str
+    dims_ok: bool
+    dims_err: str
+    cols_ok: bool
+    cols_err: str
+    data_ok: bool
+    data_err: str
+    filled_count: int
+
+    @property
+    def is_valid(self) -> bool:
+        return self.name_ok and self.dims_ok and self.cols_ok and self.data_ok
+
+
+@lru_cache(maxsize=1024)
+def _check_table_name_cached(
+    name: str,
+    existing_tables: frozenset,
+    exclude_table: Optional[str]
+) -> Tuple[bool, str]:
+    """Versión memorizada de TableValidator._check_table_name."""
+    return TableValidator._check_table_name(name, existing_tables, exclude_table)
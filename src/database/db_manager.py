@@ -7,9 +7,10 @@ import sqlite3
 import json
 import logging
 import uuid
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from contextlib import contextmanager
 
 
@@ -18,6 +19,22 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _orden_position(orden_table: Optional[str]) -> tuple:
+    """
+    Integer (row, col) copy of an orden_table JSON "[row, col]"
+
+    Returns (None, None) when orden_table is empty or malformed, matching
+    the json_extract backfill of ensure_table_order_columns.
+    """
+    if not orden_table:
+        return None, None
+    try:
+        row, col = json.loads(orden_table)
+        return int(row), int(col)
+    except (ValueError, TypeError):
+        return None, None
+
+
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
 
@@ -31,6 +48,7 @@ class DBManager:
         self.db_path = Path(db_path)
         self.connection = None
         self._fts5_available = None  # Caché para verificación de FTS5
+        self._table_order_columns_ready = False  # Caché de ensure_table_order_columns
         self._ensure_database()
         logger.info(f"Database initialized at: {self.db_path}")
 
@@ -59,6 +77,8 @@ class DBManager:
             self.connection.row_factory = sqlite3.Row
             # Enable foreign keys
             self.connection.execute("PRAGMA foreign_keys = ON")
+            # Page cache of 64 MiB (negative value = KiB)
+            self.connection.execute("PRAGMA cache_size = -65536")
         return self.connection
 
     def close(self):
@@ -1764,6 +1784,10 @@ class DBManager:
         # Usar created_at personalizado si se proporciona, de lo contrario CURRENT_TIMESTAMP
         created_at_value = created_at if created_at else None
 
+        # orden_row/orden_col always mirror orden_table
+        self.ensure_table_order_columns()
+        orden_row, orden_col = _orden_position(orden_table)
+
         query = """
             INSERT INTO items
             (category_id, label, content, type, icon, is_sensitive, is_favorite, favorite_order,
@@ -1771,9 +1795,9 @@ class DBManager:
              list_id, is_list, list_group, orden_lista, is_component, name_component,
              component_config, html_content, css_content, js_content, file_size, file_type,
              file_extension, original_filename, file_hash, preview_url, table_id, orden_table,
-             created_at, updated_at)
+             orden_row, orden_col, created_at, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                    ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), CURRENT_TIMESTAMP)
+                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), CURRENT_TIMESTAMP)
         """
         item_id = self.execute_update(
             query,
@@ -1782,7 +1806,7 @@ class DBManager:
              is_archived, list_id, is_list, list_group, orden_lista, is_component,
              name_component, component_config_json, html_content, css_content, js_content,
              file_size, file_type, file_extension, original_filename, file_hash, preview_url,
-             table_id, orden_table, created_at_value)
+             table_id, orden_table, orden_row, orden_col, created_at_value)
         )
 
         # Create tag relationships using relational structure
@@ -1835,6 +1859,13 @@ class DBManager:
                 updates.append(f"{field} = ?")
                 params.append(value)
 
+                # Keep the integer position in sync with orden_table
+                if field == 'orden_table':
+                    self.ensure_table_order_columns()
+                    updates.append("orden_row = ?")
+                    updates.append("orden_col = ?")
+                    params.extend(_orden_position(value))
+
         if updates:
             updates.append("updated_at = CURRENT_TIMESTAMP")
             params.append(item_id)
@@ -4917,9 +4948,39 @@ class DBManager:
 
     # ==================== Table Operations ====================
 
+    def ensure_table_order_columns(self):
+        """
+        Ensures items has the integer orden_row/orden_col columns
+
+        orden_table keeps the JSON "[row, col]"; the integer copies let table
+        readers skip JSON parsing. On first run the columns are added and
+        backfilled from orden_table with json_extract (one-time migration).
+        """
+        if self._table_order_columns_ready:
+            return
+
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA table_info(items)")
+            existing_columns = {row[1] for row in cursor.fetchall()}
+
+            if 'orden_row' not in existing_columns:
+                cursor.execute("ALTER TABLE items ADD COLUMN orden_row INTEGER DEFAULT NULL")
+                cursor.execute("ALTER TABLE items ADD COLUMN orden_col INTEGER DEFAULT NULL")
+                cursor.execute("""
+                    UPDATE items
+                    SET orden_row = json_extract(orden_table, '$[0]'),
+                        orden_col = json_extract(orden_table, '$[1]')
+                    WHERE orden_table IS NOT NULL AND json_valid(orden_table)
+                """)
+                logger.info(f"Added orden_row/orden_col to items ({cursor.rowcount} table cells backfilled)")
+
+        self._table_order_columns_ready = True
+
     def add_table_items(self, category_id: str, table_name: str, table_data: list,
                        column_names: list, tags: list = None, sensitive_columns: list = None,
-                       url_columns: list = None) -> dict:
+                       url_columns: list = None,
+                       progress_callback: Optional[Callable[[int, int], bool]] = None) -> dict:
         """
         Create all items for a table in a single transaction
 
@@ -4931,6 +4992,8 @@ class DBManager:
             tags: Optional list of tags to apply to all items
             sensitive_columns: Optional list of column indices that should be marked as sensitive
             url_columns: Optional list of column indices that should be marked as type URL
+            progress_callback: Optional callable(rows_done, rows_total), called before
+                each batch of rows; returning False cancels the creation (rolled back)
 
         Returns:
             dict with 'success', 'items_created', 'table_name', 'errors'
@@ -4942,6 +5005,8 @@ class DBManager:
             items_created = 0
             errors = []
 
+            self.ensure_table_order_columns()
+
             with self.transaction() as conn:
                 cursor = conn.cursor()
 
@@ -4975,8 +5040,37 @@ class DBManager:
                 # Prepare URL columns set for fast lookup
                 url_cols_set = set(url_columns) if url_columns else set()
 
+                # Un solo EncryptionManager para todas las celdas sensibles
+                encryption_manager = None
+                if sensitive_cols_set:
+                    from src.core.encryption_manager import EncryptionManager
+                    encryption_manager = EncryptionManager()
+
+                insert_item_sql = """
+                    INSERT INTO items (
+                        category_id, label, content, type,
+                        table_id, orden_table, orden_row, orden_col,
+                        is_list, list_group, orden_lista,
+                        is_sensitive, created_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))
+                """
+                category_id_int = int(category_id)
+
+                # Filas de items y sus tag IDs: se insertan en lote dentro de esta transacción
+                tag_ids_cache = {}
+                item_rows = []
+                item_tag_ids = []
+
+                # Progress is reported about every 1% of the rows
+                total_rows = len(table_data)
+                progress_step = max(1, total_rows // 100)
+
                 # Insert each cell as an item
                 for row_idx, row_data in enumerate(table_data):
+                    if progress_callback and row_idx % progress_step == 0:
+                        if progress_callback(row_idx, total_rows) is False:
+                            raise InterruptedError("Creación de tabla cancelada")
+
                     # Obtener el valor de la primera celda (nombre de fila)
                     first_cell_value = ""
                     first_cell_original = ""  # Valor original sin sanitizar para el tag
@@ -5028,65 +5122,80 @@ class DBManager:
                             # Cifrar contenido si es sensible
                             content_to_store = str(cell_value)
                             if is_sensitive and content_to_store:
-                                from src.core.encryption_manager import EncryptionManager
-                                encryption_manager = EncryptionManager()
                                 content_to_store = encryption_manager.encrypt(content_to_store)
                                 logger.debug(f"Content encrypted for sensitive column '{column_name}' at [{row_idx}, {col_idx}]")
 
-                            cursor.execute("""
-                                INSERT INTO items (
-                                    category_id, label, content, type,
-                                    table_id, orden_table,
-                                    is_list, list_group, orden_lista,
-                                    is_sensitive, created_at, updated_at
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))
-                            """, (
-                                int(category_id),  # Convert to INTEGER
+                            # Resolver IDs de tags (una consulta por tag distinto en toda la tabla)
+                            cell_tag_ids = []
+                            for tag_name in {tag.strip().lower() for tag in cell_tags if tag.strip()}:
+                                tag_id = tag_ids_cache.get(tag_name)
+                                if tag_id is None:
+                                    cursor.execute("SELECT id FROM tags WHERE name = ?", (tag_name,))
+                                    tag_row = cursor.fetchone()
+                                    if tag_row:
+                                        tag_id = tag_row['id']
+                                    else:
+                                        cursor.execute("""
+                                            INSERT INTO tags (name, usage_count, created_at, updated_at)
+                                            VALUES (?, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                                        """, (tag_name,))
+                                        tag_id = cursor.lastrowid
+                                    tag_ids_cache[tag_name] = tag_id
+                                cell_tag_ids.append(tag_id)
+
+                            item_rows.append((
+                                category_id_int,  # Convert to INTEGER
                                 column_name,  # Label = column name
                                 content_to_store,  # Content = cell value (cifrado si es sensible)
                                 item_type,  # Type (URL si está en url_columns, TEXT por defecto)
                                 table_id,  # table_id (FK a tabla tables)
                                 json.dumps([row_idx, col_idx]),  # orden_table as JSON [row, col]
+                                row_idx,  # orden_row
+                                col_idx,  # orden_col
                                 1,  # is_list = True (for row grouping)
                                 list_group_name,  # list_group = {table_name}_{primera_celda}
                                 col_idx + 1,  # orden_lista = column index + 1 (empieza en 1)
                                 is_sensitive  # is_sensitive (1 si columna marcada como sensible)
                             ))
-
-                            item_id = cursor.lastrowid
-                            items_created += 1
-
-                            # Crear relaciones en item_tags para cada tag
-                            # Usar la función set_item_tags que ya maneja la tabla tags y item_tags
-                            if cell_tags:
-                                # Necesitamos hacer esto fuera de la transacción actual
-                                # porque set_item_tags usa su propia transacción
-                                # Guardar para procesarlos después
-                                if not hasattr(self, '_pending_tags'):
-                                    self._pending_tags = []
-                                self._pending_tags.append((item_id, cell_tags))
+                            item_tag_ids.append(cell_tag_ids)
 
                         except Exception as e:
                             error_msg = f"Error creating item at [{row_idx}, {col_idx}]: {e}"
                             logger.error(error_msg)
                             errors.append(error_msg)
 
-            # Update category item_count (outside transaction)
-            self.update_category_item_count(category_id)
+                # Insertar todos los items de una vez
+                cursor.executemany(insert_item_sql, item_rows)
+                items_created = len(item_rows)
+
+                # La tabla es nueva: sus items son exactamente los recién insertados,
+                # y sus IDs crecientes siguen el orden de inserción
+                cursor.execute("SELECT id FROM items WHERE table_id = ? ORDER BY id", (table_id,))
+                item_ids = [row['id'] for row in cursor.fetchall()]
+                item_tag_pairs = [
+                    (item_id, tag_id)
+                    for item_id, cell_tag_ids in zip(item_ids, item_tag_ids)
+                    for tag_id in cell_tag_ids
+                ]
 
-            # Procesar tags pendientes (fuera de la transacción principal)
-            if hasattr(self, '_pending_tags') and self._pending_tags:
-                logger.info(f"Processing {len(self._pending_tags)} pending tag associations...")
-                for item_id, tags_list in self._pending_tags:
-                    try:
-                        self.set_item_tags(item_id, tags_list)
-                    except Exception as e:
-                        error_msg = f"Error setting tags for item {item_id}: {e}"
-                        logger.error(error_msg)
-                        errors.append(error_msg)
+                # Crear relaciones en item_tags en lote (misma transacción, sin commit por item)
+                if item_tag_pairs:
+                    logger.info(f"Inserting {len(item_tag_pairs)} tag associations...")
+                    cursor.executemany("""
+                        INSERT OR IGNORE INTO item_tags (item_id, tag_id, created_at)
+                        VALUES (?, ?, CURRENT_TIMESTAMP)
+                    """, item_tag_pairs)
+
+                    tag_usage = Counter(tag_id for _, tag_id in item_tag_pairs)
+                    cursor.executemany("""
+                        UPDATE tags
+                        SET usage_count = usage_count + ?,
+                            last_used = CURRENT_TIMESTAMP
+                        WHERE id = ?
+                    """, [(count, tag_id) for tag_id, count in tag_usage.items()])
 
-                # Limpiar tags pendientes
-                self._pending_tags = []
+            # Update category item_count (outside transaction)
+            self.update_category_item_count(category_id)
 
             logger.info(f"Table '{table_name}' created: {items_created} items")
 
@@ -5097,6 +5206,15 @@ class DBManager:
                 'errors': errors
             }
 
+        except InterruptedError as e:
+            logger.info(f"Table '{table_name}' creation cancelled")
+            return {
+                'success': False,
+                'items_created': 0,
+                'table_name': table_name,
+                'errors': [str(e)]
+            }
+
         except Exception as e:
             logger.error(f"Error creating table '{table_name}': {e}", exc_info=True)
             return {
@@ -5115,15 +5233,18 @@ class DBManager:
 
         Returns:
             List of item dictionaries ordered by [row, col]
+            (orden_row/orden_col hold the integer position)
         """
         try:
             logger.info(f"Retrieving items for table '{table_name}'")
 
+            self.ensure_table_order_columns()
+
             query = """
                 SELECT i.* FROM items i
                 INNER JOIN tables t ON i.table_id = t.id
                 WHERE t.name = ?
-                ORDER BY i.orden_table
+                ORDER BY i.orden_row, i.orden_col
             """
             results = self.execute_query(query, (table_name,))
 
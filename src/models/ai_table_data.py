@@ -7,11 +7,83 @@ Este módulo contiene las dataclasses que representan:
 - Datos completos de tabla
 - Resultados de validación
 """
+import sys
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from functools import cached_property
+from typing import Optional, List, Dict, Any, NamedTuple
 
 
-@dataclass
+# Tipos de columna válidos (internados: tras normalizar, comparar es por identidad)
+_TEXT = sys.intern('TEXT')
+_URL = sys.intern('URL')
+_VALID_COLUMN_TYPES = frozenset({_TEXT, _URL})
+
+
+class TableScan(NamedTuple):
+    """
+    Resultado de recorrer una matriz de datos una sola vez.
+
+    Attributes:
+        filled_count: Número de celdas con datos
+        any_non_list_row: Si alguna fila no es una lista (esas filas no se cuentan)
+        mismatched_rows: Índices de filas con ancho distinto al esperado
+    """
+    filled_count: int
+    any_non_list_row: bool
+    mismatched_rows: List[int]
+
+
+def is_filled(cell: Any) -> bool:
+    """
+    Indica si una celda tiene datos (no vacía ni solo espacios).
+
+    Para strings usa isspace(), que solo lee el texto, en lugar de crear
+    una copia con strip().
+    """
+    if not cell:
+        return False
+    text = cell if type(cell) is str else str(cell)
+    return bool(text) and not text.isspace()
+
+
+def scan_table(table_data: List[List[str]], expected_cols: Optional[int] = None) -> TableScan:
+    """
+    Cuenta celdas llenas y revisa la forma de la matriz en un solo recorrido.
+
+    Args:
+        table_data: Matriz de datos (lista de listas)
+        expected_cols: Ancho esperado de cada fila (None para no comprobarlo)
+
+    Returns:
+        TableScan con el conteo y los problemas de forma detectados
+    """
+    filled_count = 0
+    any_non_list_row = False
+    mismatched_rows = []
+    _isspace = str.isspace
+    for i, row in enumerate(table_data):
+        if not isinstance(row, list):
+            # Fila con formato inválido: se reporta y no se cuenta
+            any_non_list_row = True
+            continue
+        if expected_cols is not None and len(row) != expected_cols:
+            mismatched_rows.append(i)
+
+        try:
+            # Filas de solo strings: llenas = total - vacías - solo espacios,
+            # todo dentro de C y sin copias de las celdas
+            filled_count += len(row) - row.count('') - sum(map(_isspace, row))
+            continue
+        except TypeError:
+            # Hay celdas que no son str: recorrer la fila celda por celda
+            pass
+
+        filled_count += sum(map(is_filled, row))
+
+    return TableScan(filled_count, any_non_list_row, mismatched_rows)
+
+
+@dataclass(slots=True)
 class TableColumnConfig:
     """
     Configuración de una columna de tabla.
@@ -29,11 +101,13 @@ class TableColumnConfig:
 
     def __post_init__(self):
         """Valida que el tipo sea válido."""
-        if self.type not in ('TEXT', 'URL'):
-            self.type = 'TEXT'
+        if self.type in _VALID_COLUMN_TYPES:
+            self.type = sys.intern(self.type)
+        else:
+            self.type = _TEXT
 
 
-@dataclass
+@dataclass(slots=True)
 class TableConfigData:
     """
     Configuración general de la tabla.
@@ -57,6 +131,9 @@ class TableStructureData:
     """
     Estructura de la tabla (definición de columnas).
 
+    Los nombres e índices derivados se calculan una sola vez, por lo que no
+    se admite modificar columns después de construir la estructura.
+
     Attributes:
         columns: Lista de configuraciones de columnas
     """
@@ -64,18 +141,31 @@ class TableStructureData:
 
     def get_column_names(self) -> List[str]:
         """Retorna lista de nombres de columnas."""
-        return [col.name for col in self.columns]
+        return list(self._column_names)
 
     def get_sensitive_indices(self) -> List[int]:
         """Retorna índices de columnas sensibles."""
-        return [i for i, col in enumerate(self.columns) if col.is_sensitive]
+        return list(self._sensitive_indices)
 
     def get_url_indices(self) -> List[int]:
         """Retorna índices de columnas tipo URL."""
-        return [i for i, col in enumerate(self.columns) if col.type == 'URL']
+        return list(self._url_indices)
 
+    # Cachés de los getters (tuplas: los getters devuelven copias en lista)
+    @cached_property
+    def _column_names(self) -> tuple:
+        return tuple(col.name for col in self.columns)
 
-@dataclass
+    @cached_property
+    def _sensitive_indices(self) -> tuple:
+        return tuple(i for i, col in enumerate(self.columns) if col.is_sensitive)
+
+    @cached_property
+    def _url_indices(self) -> tuple:
+        return tuple(i for i, col in enumerate(self.columns) if col.type == _URL)
+
+
+@dataclass(slots=True)
 class AITableData:
     """
     Datos completos de tabla generada por IA.
@@ -100,17 +190,61 @@ class AITableData:
     cols_count: int = 0
     filled_cells_count: int = 0
 
+    # Recorrido de table_data hecho en __post_init__ (conteo y filas con ancho incorrecto)
+    _scan: Optional[TableScan] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Calcula metadata automáticamente."""
         self.rows_count = len(self.table_data)
         self.cols_count = len(self.table_structure.columns)
 
-        # Contar celdas llenas
-        self.filled_cells_count = sum(
-            1 for row in self.table_data
-            for cell in row
-            if cell and str(cell).strip()
-        )
+        # Contar celdas llenas y detectar filas con ancho incorrecto en un solo recorrido
+        self._scan = scan_table(self.table_data, self.cols_count)
+        self.filled_cells_count = self._scan.filled_count
+
+    @classmethod
+    def unchecked(
+        cls,
+        table_config: TableConfigData,
+        table_structure: TableStructureData,
+        table_data: List[List[str]],
+        scan: TableScan
+    ) -> 'AITableData':
+        """
+        Construye la instancia sin volver a recorrer table_data.
+
+        Para llamadores que ya tienen el resultado de scan_table (calculado con
+        el ancho de table_structure); no se revalida nada.
+
+        Args:
+            table_config: Configuración general
+            table_structure: Definición de columnas
+            table_data: Matriz de datos
+            scan: Resultado de scan_table(table_data, len(table_structure.columns))
+
+        Returns:
+            AITableData con la metadata tomada de scan
+        """
+        instance = cls.__new__(cls)
+        instance.table_config = table_config
+        instance.table_structure = table_structure
+        instance.table_data = table_data
+        instance.rows_count = len(table_data)
+        instance.cols_count = len(table_structure.columns)
+        instance.filled_cells_count = scan.filled_count
+        instance._scan = scan
+        return instance
+
+    def get_scan(self) -> TableScan:
+        """
+        Retorna el recorrido de table_data hecho al construir la instancia.
+
+        Permite a TableValidator/TableController reutilizarlo en lugar de
+        volver a contar las celdas.
+        """
+        return self._scan
 
     def get_fill_percentage(self) -> float:
         """
@@ -131,19 +265,18 @@ class AITableData:
         Returns:
             Tuple (is_valid, errors)
         """
-        errors = []
+        # Las filas con ancho incorrecto ya se detectaron en __post_init__
+        inconsistent_rows = self._scan.mismatched_rows
+        if not inconsistent_rows:
+            return True, []
 
-        # Verificar que todas las filas tengan el mismo número de columnas
         expected_cols = self.cols_count
-        for i, row in enumerate(self.table_data):
-            if len(row) != expected_cols:
-                errors.append(
-                    f"Fila {i+1} tiene {len(row)} columnas, "
-                    f"esperadas {expected_cols}"
-                )
-
-        is_valid = len(errors) == 0
-        return is_valid, errors
+        errors = [
+            f"Fila {i+1} tiene {len(self.table_data[i])} columnas, "
+            f"esperadas {expected_cols}"
+            for i in inconsistent_rows
+        ]
+        return False, errors
 
 
 @dataclass
@@ -187,7 +320,7 @@ class AITablePromptConfig:
             self.expected_cols = 20
 
 
-@dataclass
+@dataclass(slots=True)
 class TableValidationResult:
     """
     Resultado de validación de JSON de tabla.
@@ -0,0 +1,164 @@
+"""
+Validador del schema de tablas IA (AITableJSONValidator.SCHEMA).
+
+ARCHIVO GENERADO por scripts/gen_ai_table_validator.py con
+fastjsonschema.compile_to_code; no editar a mano.
+"""
+VERSION = "2.19.0"
+from decimal import Decimal
+
+
+class JsonSchemaValueException(ValueError):
+    """Error de validación (mismos atributos que el de fastjsonschema)."""
+
+    def __init__(self, message, value=None, name=None, definition=None, rule=None):
+        super().__init__(message)
+        self.message = message
+        self.value = value
+        self.name = name
+        self.definition = definition
+        self.rule = rule
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'type': 'object', 'required': ['table_config', 'table_structure', 'table_data'], 'properties': {'table_config': {'type': 'object', 'required': ['table_name', 'category_id'], 'properties': {'table_name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'category_id': {'type': 'integer', 'minimum': 1}, 'tags': {'type': 'array', 'items': {'type': 'string'}}, 'auto_detect_sensitive': {'type': 'boolean'}, 'auto_detect_urls': {'type': 'boolean'}}}, 'table_structure': {'type': 'object', 'required': ['columns'], 'properties': {'columns': {'type': 'array', 'minItems': 1, 'maxItems': 20, 'items': {'type': 'object', 'required': ['name'], 'properties': {'name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'type': {'enum': ['TEXT', 'URL']}, 'is_sensitive': {'type': 'boolean'}, 'description': {'type': 'string'}}}}}}, 'table_data': {'type': 'array', 'minItems': 1, 'maxItems': 100, 'items': {'type': 'array', 'items': {'type': 'string'}}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['table_config', 'table_structure', 'table_data']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'type': 'object', 'required': ['table_config', 'table_structure', 'table_data'], 'properties': {'table_config': {'type': 'object', 'required': ['table_name', 'category_id'], 'properties': {'table_name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'category_id': {'type': 'integer', 'minimum': 1}, 'tags': {'type': 'array', 'items': {'type': 'string'}}, 'auto_detect_sensitive': {'type': 'boolean'}, 'auto_detect_urls': {'type': 'boolean'}}}, 'table_structure': {'type': 'object', 'required': ['columns'], 'properties': {'columns': {'type': 'array', 'minItems': 1, 'maxItems': 20, 'items': {'type': 'object', 'required': ['name'], 'properties': {'name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'type': {'enum': ['TEXT', 'URL']}, 'is_sensitive': {'type': 'boolean'}, 'description': {'type': 'string'}}}}}}, 'table_data': {'type': 'array', 'minItems': 1, 'maxItems': 100, 'items': {'type': 'array', 'items': {'type': 'string'}}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "table_config" in data_keys:
+            data_keys.remove("table_config")
+            data__tableconfig = data["table_config"]
+            if not isinstance(data__tableconfig, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_config must be object", value=data__tableconfig, name="" + (name_prefix or "data") + ".table_config", definition={'type': 'object', 'required': ['table_name', 'category_id'], 'properties': {'table_name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'category_id': {'type': 'integer', 'minimum': 1}, 'tags': {'type': 'array', 'items': {'type': 'string'}}, 'auto_detect_sensitive': {'type': 'boolean'}, 'auto_detect_urls': {'type': 'boolean'}}}, rule='type')
+            data__tableconfig_is_dict = isinstance(data__tableconfig, dict)
+            if data__tableconfig_is_dict:
+                data__tableconfig__missing_keys = set(['table_name', 'category_id']) - data__tableconfig.keys()
+                if data__tableconfig__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_config must contain " + (str(sorted(data__tableconfig__missing_keys)) + " properties"), value=data__tableconfig, name="" + (name_prefix or "data") + ".table_config", definition={'type': 'object', 'required': ['table_name', 'category_id'], 'properties': {'table_name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'category_id': {'type': 'integer', 'minimum': 1}, 'tags': {'type': 'array', 'items': {'type': 'string'}}, 'auto_detect_sensitive': {'type': 'boolean'}, 'auto_detect_urls': {'type': 'boolean'}}}, rule='required')
+                data__tableconfig_keys = set(data__tableconfig.keys())
+                if "table_name" in data__tableconfig_keys:
+                    data__tableconfig_keys.remove("table_name")
+                    data__tableconfig__tablename = data__tableconfig["table_name"]
+                    if not isinstance(data__tableconfig__tablename, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_config.table_name must be string", value=data__tableconfig__tablename, name="" + (name_prefix or "data") + ".table_config.table_name", definition={'type': 'string', 'minLength': 1, 'maxLength': 50}, rule='type')
+                    if isinstance(data__tableconfig__tablename, str):
+                        data__tableconfig__tablename_len = len(data__tableconfig__tablename)
+                        if data__tableconfig__tablename_len < 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_config.table_name must be longer than or equal to 1 characters", value=data__tableconfig__tablename, name="" + (name_prefix or "data") + ".table_config.table_name", definition={'type': 'string', 'minLength': 1, 'maxLength': 50}, rule='minLength')
+                        if data__tableconfig__tablename_len > 50:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_config.table_name must be shorter than or equal to 50 characters", value=data__tableconfig__tablename, name="" + (name_prefix or "data") + ".table_config.table_name", definition={'type': 'string', 'minLength': 1, 'maxLength': 50}, rule='maxLength')
+                if "category_id" in data__tableconfig_keys:
+                    data__tableconfig_keys.remove("category_id")
+                    data__tableconfig__categoryid = data__tableconfig["category_id"]
+                    if not isinstance(data__tableconfig__categoryid, (int)) and not (isinstance(data__tableconfig__categoryid, float) and data__tableconfig__categoryid.is_integer()) or isinstance(data__tableconfig__categoryid, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_config.category_id must be integer", value=data__tableconfig__categoryid, name="" + (name_prefix or "data") + ".table_config.category_id", definition={'type': 'integer', 'minimum': 1}, rule='type')
+                    if isinstance(data__tableconfig__categoryid, (int, float, Decimal)):
+                        if data__tableconfig__categoryid < 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_config.category_id must be bigger than or equal to 1", value=data__tableconfig__categoryid, name="" + (name_prefix or "data") + ".table_config.category_id", definition={'type': 'integer', 'minimum': 1}, rule='minimum')
+                if "tags" in data__tableconfig_keys:
+                    data__tableconfig_keys.remove("tags")
+                    data__tableconfig__tags = data__tableconfig["tags"]
+                    if not isinstance(data__tableconfig__tags, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_config.tags must be array", value=data__tableconfig__tags, name="" + (name_prefix or "data") + ".table_config.tags", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__tableconfig__tags_is_list = isinstance(data__tableconfig__tags, (list, tuple))
+                    if data__tableconfig__tags_is_list:
+                        data__tableconfig__tags_len = len(data__tableconfig__tags)
+                        for data__tableconfig__tags_x, data__tableconfig__tags_item in enumerate(data__tableconfig__tags):
+                            if not isinstance(data__tableconfig__tags_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_config.tags[{data__tableconfig__tags_x}]".format(**locals()) + " must be string", value=data__tableconfig__tags_item, name="" + (name_prefix or "data") + ".table_config.tags[{data__tableconfig__tags_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "auto_detect_sensitive" in data__tableconfig_keys:
+                    data__tableconfig_keys.remove("auto_detect_sensitive")
+                    data__tableconfig__autodetectsensitive = data__tableconfig["auto_detect_sensitive"]
+                    if not isinstance(data__tableconfig__autodetectsensitive, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_config.auto_detect_sensitive must be boolean", value=data__tableconfig__autodetectsensitive, name="" + (name_prefix or "data") + ".table_config.auto_detect_sensitive", definition={'type': 'boolean'}, rule='type')
+                if "auto_detect_urls" in data__tableconfig_keys:
+                    data__tableconfig_keys.remove("auto_detect_urls")
+                    data__tableconfig__autodetecturls = data__tableconfig["auto_detect_urls"]
+                    if not isinstance(data__tableconfig__autodetecturls, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_config.auto_detect_urls must be boolean", value=data__tableconfig__autodetecturls, name="" + (name_prefix or "data") + ".table_config.auto_detect_urls", definition={'type': 'boolean'}, rule='type')
+        if "table_structure" in data_keys:
+            data_keys.remove("table_structure")
+            data__tablestructure = data["table_structure"]
+            if not isinstance(data__tablestructure, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure must be object", value=data__tablestructure, name="" + (name_prefix or "data") + ".table_structure", definition={'type': 'object', 'required': ['columns'], 'properties': {'columns': {'type': 'array', 'minItems': 1, 'maxItems': 20, 'items': {'type': 'object', 'required': ['name'], 'properties': {'name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'type': {'enum': ['TEXT', 'URL']}, 'is_sensitive': {'type': 'boolean'}, 'description': {'type': 'string'}}}}}}, rule='type')
+            data__tablestructure_is_dict = isinstance(data__tablestructure, dict)
+            if data__tablestructure_is_dict:
+                data__tablestructure__missing_keys = set(['columns']) - data__tablestructure.keys()
+                if data__tablestructure__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure must contain " + (str(sorted(data__tablestructure__missing_keys)) + " properties"), value=data__tablestructure, name="" + (name_prefix or "data") + ".table_structure", definition={'type': 'object', 'required': ['columns'], 'properties': {'columns': {'type': 'array', 'minItems': 1, 'maxItems': 20, 'items': {'type': 'object', 'required': ['name'], 'properties': {'name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'type': {'enum': ['TEXT', 'URL']}, 'is_sensitive': {'type': 'boolean'}, 'description': {'type': 'string'}}}}}}, rule='required')
+                data__tablestructure_keys = set(data__tablestructure.keys())
+                if "columns" in data__tablestructure_keys:
+                    data__tablestructure_keys.remove("columns")
+                    data__tablestructure__columns = data__tablestructure["columns"]
+                    if not isinstance(data__tablestructure__columns, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure.columns must be array", value=data__tablestructure__columns, name="" + (name_prefix or "data") + ".table_structure.columns", definition={'type': 'array', 'minItems': 1, 'maxItems': 20, 'items': {'type': 'object', 'required': ['name'], 'properties': {'name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'type': {'enum': ['TEXT', 'URL']}, 'is_sensitive': {'type': 'boolean'}, 'description': {'type': 'string'}}}}, rule='type')
+                    data__tablestructure__columns_is_list = isinstance(data__tablestructure__columns, (list, tuple))
+                    if data__tablestructure__columns_is_list:
+                        data__tablestructure__columns_len = len(data__tablestructure__columns)
+                        if data__tablestructure__columns_len < 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure.columns must contain at least 1 items", value=data__tablestructure__columns, name="" + (name_prefix or "data") + ".table_structure.columns", definition={'type': 'array', 'minItems': 1, 'maxItems': 20, 'items': {'type': 'object', 'required': ['name'], 'properties': {'name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'type': {'enum': ['TEXT', 'URL']}, 'is_sensitive': {'type': 'boolean'}, 'description': {'type': 'string'}}}}, rule='minItems')
+                        if data__tablestructure__columns_len > 20:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure.columns must contain less than or equal to 20 items", value=data__tablestructure__columns, name="" + (name_prefix or "data") + ".table_structure.columns", definition={'type': 'array', 'minItems': 1, 'maxItems': 20, 'items': {'type': 'object', 'required': ['name'], 'properties': {'name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'type': {'enum': ['TEXT', 'URL']}, 'is_sensitive': {'type': 'boolean'}, 'description': {'type': 'string'}}}}, rule='maxItems')
+                        for data__tablestructure__columns_x, data__tablestructure__columns_item in enumerate(data__tablestructure__columns):
+                            if not isinstance(data__tablestructure__columns_item, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}]".format(**locals()) + " must be object", value=data__tablestructure__columns_item, name="" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['name'], 'properties': {'name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'type': {'enum': ['TEXT', 'URL']}, 'is_sensitive': {'type': 'boolean'}, 'description': {'type': 'string'}}}, rule='type')
+                            data__tablestructure__columns_item_is_dict = isinstance(data__tablestructure__columns_item, dict)
+                            if data__tablestructure__columns_item_is_dict:
+                                data__tablestructure__columns_item__missing_keys = set(['name']) - data__tablestructure__columns_item.keys()
+                                if data__tablestructure__columns_item__missing_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}]".format(**locals()) + " must contain " + (str(sorted(data__tablestructure__columns_item__missing_keys)) + " properties"), value=data__tablestructure__columns_item, name="" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['name'], 'properties': {'name': {'type': 'string', 'minLength': 1, 'maxLength': 50}, 'type': {'enum': ['TEXT', 'URL']}, 'is_sensitive': {'type': 'boolean'}, 'description': {'type': 'string'}}}, rule='required')
+                                data__tablestructure__columns_item_keys = set(data__tablestructure__columns_item.keys())
+                                if "name" in data__tablestructure__columns_item_keys:
+                                    data__tablestructure__columns_item_keys.remove("name")
+                                    data__tablestructure__columns_item__name = data__tablestructure__columns_item["name"]
+                                    if not isinstance(data__tablestructure__columns_item__name, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].name".format(**locals()) + " must be string", value=data__tablestructure__columns_item__name, name="" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].name".format(**locals()) + "", definition={'type': 'string', 'minLength': 1, 'maxLength': 50}, rule='type')
+                                    if isinstance(data__tablestructure__columns_item__name, str):
+                                        data__tablestructure__columns_item__name_len = len(data__tablestructure__columns_item__name)
+                                        if data__tablestructure__columns_item__name_len < 1:
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].name".format(**locals()) + " must be longer than or equal to 1 characters", value=data__tablestructure__columns_item__name, name="" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].name".format(**locals()) + "", definition={'type': 'string', 'minLength': 1, 'maxLength': 50}, rule='minLength')
+                                        if data__tablestructure__columns_item__name_len > 50:
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].name".format(**locals()) + " must be shorter than or equal to 50 characters", value=data__tablestructure__columns_item__name, name="" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].name".format(**locals()) + "", definition={'type': 'string', 'minLength': 1, 'maxLength': 50}, rule='maxLength')
+                                if "type" in data__tablestructure__columns_item_keys:
+                                    data__tablestructure__columns_item_keys.remove("type")
+                                    data__tablestructure__columns_item__type = data__tablestructure__columns_item["type"]
+                                    if data__tablestructure__columns_item__type not in ['TEXT', 'URL']:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].type".format(**locals()) + " must be one of ['TEXT', 'URL']", value=data__tablestructure__columns_item__type, name="" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].type".format(**locals()) + "", definition={'enum': ['TEXT', 'URL']}, rule='enum')
+                                if "is_sensitive" in data__tablestructure__columns_item_keys:
+                                    data__tablestructure__columns_item_keys.remove("is_sensitive")
+                                    data__tablestructure__columns_item__issensitive = data__tablestructure__columns_item["is_sensitive"]
+                                    if not isinstance(data__tablestructure__columns_item__issensitive, (bool)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].is_sensitive".format(**locals()) + " must be boolean", value=data__tablestructure__columns_item__issensitive, name="" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].is_sensitive".format(**locals()) + "", definition={'type': 'boolean'}, rule='type')
+                                if "description" in data__tablestructure__columns_item_keys:
+                                    data__tablestructure__columns_item_keys.remove("description")
+                                    data__tablestructure__columns_item__description = data__tablestructure__columns_item["description"]
+                                    if not isinstance(data__tablestructure__columns_item__description, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].description".format(**locals()) + " must be string", value=data__tablestructure__columns_item__description, name="" + (name_prefix or "data") + ".table_structure.columns[{data__tablestructure__columns_x}].description".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "table_data" in data_keys:
+            data_keys.remove("table_data")
+            data__tabledata = data["table_data"]
+            if not isinstance(data__tabledata, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_data must be array", value=data__tabledata, name="" + (name_prefix or "data") + ".table_data", definition={'type': 'array', 'minItems': 1, 'maxItems': 100, 'items': {'type': 'array', 'items': {'type': 'string'}}}, rule='type')
+            data__tabledata_is_list = isinstance(data__tabledata, (list, tuple))
+            if data__tabledata_is_list:
+                data__tabledata_len = len(data__tabledata)
+                if data__tabledata_len < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_data must contain at least 1 items", value=data__tabledata, name="" + (name_prefix or "data") + ".table_data", definition={'type': 'array', 'minItems': 1, 'maxItems': 100, 'items': {'type': 'array', 'items': {'type': 'string'}}}, rule='minItems')
+                if data__tabledata_len > 100:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_data must contain less than or equal to 100 items", value=data__tabledata, name="" + (name_prefix or "data") + ".table_data", definition={'type': 'array', 'minItems': 1, 'maxItems': 100, 'items': {'type': 'array', 'items': {'type': 'string'}}}, rule='maxItems')
+                for data__tabledata_x, data__tabledata_item in enumerate(data__tabledata):
+                    if not isinstance(data__tabledata_item, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_data[{data__tabledata_x}]".format(**locals()) + " must be array", value=data__tabledata_item, name="" + (name_prefix or "data") + ".table_data[{data__tabledata_x}]".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__tabledata_item_is_list = isinstance(data__tabledata_item, (list, tuple))
+                    if data__tabledata_item_is_list:
+                        data__tabledata_item_len = len(data__tabledata_item)
+                        for data__tabledata_item_x, data__tabledata_item_item in enumerate(data__tabledata_item):
+                            if not isinstance(data__tabledata_item_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".table_data[{data__tabledata_x}][{data__tabledata_item_x}]".format(**locals()) + " must be string", value=data__tabledata_item_item, name="" + (name_prefix or "data") + ".table_data[{data__tabledata_x}][{data__tabledata_item_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+    return data
\ No newline at end of file
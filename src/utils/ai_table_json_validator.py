@@ -5,23 +5,48 @@ Valida que el JSON tenga la estructura correcta y datos coherentes.
 """
 import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO, Callable, Iterator, List, Optional, Tuple, Union
 
 try:
-    from jsonschema import validate, ValidationError, Draft7Validator
-    JSONSCHEMA_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    JSONSCHEMA_AVAILABLE = False
-    logging.warning("jsonschema not available, using basic validation")
+    ORJSON_AVAILABLE = False
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
 
-from models.ai_table_data import TableValidationResult
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# jsonschema solo se necesita (y se importa) si no hay fastjsonschema
+JSONSCHEMA_AVAILABLE = False
+if not FASTJSONSCHEMA_AVAILABLE:
+    try:
+        from jsonschema import Draft7Validator
+        JSONSCHEMA_AVAILABLE = True
+    except ImportError:
+        logging.warning("jsonschema not available, using basic validation")
+
+from models.ai_table_data import TableValidationResult, scan_table
+from utils._ai_table_schema_validator import (
+    JsonSchemaValueException as GeneratedSchemaError,
+    validate as _generated_validate,
+)
 
 logger = logging.getLogger(__name__)
 
+# A partir de este tamaño validate_json_string valida en streaming. Una tabla
+# del schema (100×20) con celdas normales ocupa decenas de KB; por debajo de
+# varios MB el parseo completo con orjson es más rápido que ijson
+_STREAM_MIN_SIZE = 8 * 1024 * 1024
+
 
 class AITableJSONValidator:
     """Validador de estructura JSON para tablas de IA."""
@@ -81,12 +106,15 @@ class AITableJSONValidator:
     }
 
     @staticmethod
-    def validate_json_string(json_str: str) -> TableValidationResult:
+    def validate_json_string(json_str: str, skip_schema: bool = False) -> TableValidationResult:
         """
         Valida string JSON de tabla.
 
         Args:
             json_str: String con JSON a validar
+            skip_schema: Omitir la validación de schema (solo para JSON generado
+                internamente, cuya estructura ya se conoce). Se mantienen la
+                verificación de ancho de filas, las dimensiones y las advertencias
 
         Returns:
             TableValidationResult con resultado de validación
@@ -97,95 +125,205 @@ class AITableJSONValidator:
             >>> if result.is_valid:
             ...     print("JSON válido!")
         """
+        if IJSON_AVAILABLE and len(json_str) > _STREAM_MIN_SIZE:
+            # Respuestas grandes: validar sin construir las filas de table_data
+            return AITableJSONValidator.validate_json_stream(json_str, skip_schema)
+        return AITableJSONValidator._validate_parsed(json_str, skip_schema)
+
+    @staticmethod
+    def validate_json_stream(
+        source: Union[str, bytes, BinaryIO],
+        skip_schema: bool = False
+    ) -> TableValidationResult:
+        """
+        Valida JSON de tabla leyéndolo en streaming (ijson).
+
+        Las claves de primer nivel se construyen normalmente salvo table_data,
+        cuyas filas no se materializan: solo se cuentan sus celdas y las que
+        tienen datos. Ante cualquier error (sintaxis, schema o filas de distinto
+        ancho) se repite la validación completa, de modo que los mensajes son
+        exactamente los de validate_json_string.
+
+        Args:
+            source: String/bytes JSON, o archivo binario posicionable (seek)
+            skip_schema: Omitir la validación de schema (ver validate_json_string)
+
+        Returns:
+            TableValidationResult con resultado de validación
+        """
+        is_file = hasattr(source, 'read')
+        start = source.tell() if is_file else 0
+
+        def validate_parsed() -> TableValidationResult:
+            if is_file:
+                source.seek(start)
+                return AITableJSONValidator._validate_parsed(source.read(), skip_schema)
+            return AITableJSONValidator._validate_parsed(source, skip_schema)
+
+        if not IJSON_AVAILABLE:
+            return validate_parsed()
+
+        # ijson trabaja con bytes: un str se codifica aquí una sola vez
+        # (pasarlo tal cual está deprecado y lo recodifica por bloques)
+        stream = source.encode('utf-8') if isinstance(source, str) else source
+        try:
+            scan = _scan_json_events(ijson.basic_parse(stream, use_float=True))
+        except (ijson.JSONError, ValueError):
+            scan = None
+        if scan is None:
+            return validate_parsed()
+
+        data, row_lengths, filled_count = scan
+
+        if not skip_schema:
+            # table_data ya cumple el schema: se sustituye por una fila vacía
+            # (válida) para verificar el resto del documento
+            data['table_data'] = [[]]
+            if _check_schema is not None:
+                if _check_schema(data) is not None:
+                    return validate_parsed()
+            elif AITableJSONValidator._basic_validation(data):
+                return validate_parsed()
+
+        try:
+            num_cols = len(data['table_structure']['columns'])
+        except (KeyError, TypeError):
+            # Solo posible sin schema: el error lo reporta el parseo completo
+            return validate_parsed()
+        rows_count = len(row_lengths)
+        if row_lengths.count(num_cols) != rows_count:
+            return validate_parsed()
+
+        result = TableValidationResult(is_valid=False)
+        AITableJSONValidator._finish_validation(result, rows_count, num_cols, filled_count)
+        return result
+
+    @staticmethod
+    def _validate_parsed(json_str: Union[str, bytes], skip_schema: bool = False) -> TableValidationResult:
+        """
+        Valida JSON de tabla parseando el documento completo.
+
+        Args:
+            json_str: String con JSON a validar
+            skip_schema: Omitir la validación de schema (ver validate_json_string)
+
+        Returns:
+            TableValidationResult con resultado de validación
+        """
         result = TableValidationResult(is_valid=False)
 
-        # 1. Validar syntax JSON
+        # 1. Validar syntax JSON (orjson si está disponible; su JSONDecodeError
+        # hereda de json.JSONDecodeError)
         try:
-            data = json.loads(json_str)
+            data = orjson.loads(json_str) if ORJSON_AVAILABLE else json.loads(json_str)
         except json.JSONDecodeError as e:
             error_msg = f"JSON inválido: {str(e)}"
             result.errors.append(error_msg)
             logger.error(f"JSON parse error: {e}")
             return result
 
-        # 2. Validar contra schema (si jsonschema está disponible)
-        if JSONSCHEMA_AVAILABLE:
-            try:
-                validate(instance=data, schema=AITableJSONValidator.SCHEMA)
-            except ValidationError as e:
-                error_msg = f"Estructura inválida: {e.message}"
-                result.errors.append(error_msg)
-                logger.error(f"Schema validation error: {e.message}")
-                return result
-        else:
-            # Validación básica manual
-            validation_errors = AITableJSONValidator._basic_validation(data)
-            if validation_errors:
-                result.errors.extend(validation_errors)
-                return result
+        # 2. Validar contra schema con el validador precompilado (si hay librería
+        # disponible), salvo que el llamador lo omita
+        if not skip_schema:
+            if _check_schema is not None:
+                schema_error = _check_schema(data)
+                if schema_error is not None:
+                    error_msg = f"Estructura inválida: {schema_error}"
+                    result.errors.append(error_msg)
+                    logger.error(f"Schema validation error: {schema_error}")
+                    return result
+            else:
+                # Validación básica manual
+                validation_errors = AITableJSONValidator._basic_validation(data)
+                if validation_errors:
+                    result.errors.extend(validation_errors)
+                    return result
 
         # 3. Validaciones adicionales
         try:
             # Verificar que todas las filas tengan el mismo número de columnas
+            # (longitudes con map(len), en C; los mensajes solo si alguna difiere)
             num_cols = len(data['table_structure']['columns'])
-            for i, row in enumerate(data['table_data']):
-                if len(row) != num_cols:
-                    result.errors.append(
-                        f"Fila {i+1} tiene {len(row)} columnas, "
-                        f"esperadas {num_cols}"
-                    )
-
-            if result.errors:
+            table_data = data['table_data']
+            rows_count = len(table_data)
+            row_lengths = list(map(len, table_data))
+            if row_lengths.count(num_cols) != rows_count:
+                result.errors.extend(
+                    f"Fila {i+1} tiene {row_len} columnas, "
+                    f"esperadas {num_cols}"
+                    for i, row_len in enumerate(row_lengths)
+                    if row_len != num_cols
+                )
                 return result
 
-            # Dimensiones
-            rows_count = len(data['table_data'])
-            result.dimensions = {
-                'rows': rows_count,
-                'cols': num_cols
-            }
+            AITableJSONValidator._finish_validation(
+                result, rows_count, num_cols, scan_table(table_data).filled_count
+            )
 
-            # Warnings opcionales
-            if num_cols > 10:
-                result.warnings.append(
-                    f"Tabla tiene {num_cols} columnas (muchas columnas pueden "
-                    "dificultar la visualización)"
-                )
+        except Exception as e:
+            result.errors.append(f"Error en validación adicional: {str(e)}")
+            logger.error(f"Additional validation error: {e}", exc_info=True)
 
-            if rows_count > 50:
-                result.warnings.append(
-                    f"Tabla tiene {rows_count} filas (puede tardar en crearse)"
-                )
+        return result
 
-            # Advertencia si hay muchas celdas vacías
-            empty_cells = sum(
-                1 for row in data['table_data']
-                for cell in row
-                if not cell or not str(cell).strip()
+    @staticmethod
+    def _finish_validation(
+        result: TableValidationResult,
+        rows_count: int,
+        num_cols: int,
+        filled_count: int
+    ) -> None:
+        """
+        Completa el resultado de una tabla cuyas filas tienen todas num_cols
+        celdas: dimensiones, advertencias y marca de válido.
+
+        Args:
+            result: Resultado a completar
+            rows_count: Número de filas
+            num_cols: Número de columnas
+            filled_count: Número de celdas con datos
+        """
+        # Dimensiones
+        result.dimensions = {
+            'rows': rows_count,
+            'cols': num_cols
+        }
+
+        # Warnings opcionales
+        if num_cols > 10:
+            result.warnings.append(
+                f"Tabla tiene {num_cols} columnas (muchas columnas pueden "
+                "dificultar la visualización)"
             )
-            total_cells = rows_count * num_cols
-            empty_percentage = (empty_cells / total_cells * 100) if total_cells > 0 else 0
 
-            if empty_percentage > 30:
-                result.warnings.append(
-                    f"{empty_percentage:.1f}% de celdas vacías "
-                    "(considera reducir filas/columnas)"
-                )
+        if rows_count > 50:
+            result.warnings.append(
+                f"Tabla tiene {rows_count} filas (puede tardar en crearse)"
+            )
 
-            # Validación exitosa
-            result.is_valid = True
-            logger.info(f"JSON validated successfully: {rows_count}×{num_cols} table")
+        # Advertencia si hay muchas celdas vacías (todas las filas ya tienen
+        # num_cols celdas, así que vacías = total - llenas)
+        total_cells = rows_count * num_cols
+        empty_cells = total_cells - filled_count
+        empty_percentage = (empty_cells / total_cells * 100) if total_cells > 0 else 0
 
-        except Exception as e:
-            result.errors.append(f"Error en validación adicional: {str(e)}")
-            logger.error(f"Additional validation error: {e}", exc_info=True)
+        if empty_percentage > 30:
+            result.warnings.append(
+                f"{empty_percentage:.1f}% de celdas vacías "
+                "(considera reducir filas/columnas)"
+            )
 
-        return result
+        # Validación exitosa
+        result.is_valid = True
+        logger.info(f"JSON validated successfully: {rows_count}×{num_cols} table")
 
     @staticmethod
     def _basic_validation(data: Dict[str, Any]) -> list:
         """
-        Validación básica manual (cuando jsonschema no está disponible).
+        Validación sin librerías de schema (cuando jsonschema no está disponible).
+
+        Usa el validador de SCHEMA generado con fastjsonschema.compile_to_code
+        (Python puro, ver scripts/gen_ai_table_validator.py).
 
         Args:
             data: Diccionario parseado del JSON
@@ -193,62 +331,11 @@ class AITableJSONValidator:
         Returns:
             Lista de errores (vacía si es válido)
         """
-        errors = []
-
-        # Verificar campos requeridos de primer nivel
-        if 'table_config' not in data:
-            errors.append("Falta campo requerido: 'table_config'")
-        if 'table_structure' not in data:
-            errors.append("Falta campo requerido: 'table_structure'")
-        if 'table_data' not in data:
-            errors.append("Falta campo requerido: 'table_data'")
-
-        if errors:
-            return errors
-
-        # Validar table_config
-        config = data['table_config']
-        if 'table_name' not in config or not config['table_name']:
-            errors.append("table_config.table_name es requerido")
-        if 'category_id' not in config or not isinstance(config['category_id'], int):
-            errors.append("table_config.category_id debe ser un entero")
-
-        # Validar table_structure
-        structure = data['table_structure']
-        if 'columns' not in structure:
-            errors.append("table_structure.columns es requerido")
-        elif not isinstance(structure['columns'], list):
-            errors.append("table_structure.columns debe ser un array")
-        elif len(structure['columns']) == 0:
-            errors.append("table_structure.columns no puede estar vacío")
-        elif len(structure['columns']) > 20:
-            errors.append("table_structure.columns: máximo 20 columnas")
-        else:
-            # Validar cada columna
-            for i, col in enumerate(structure['columns']):
-                if not isinstance(col, dict):
-                    errors.append(f"Columna {i+1} debe ser un objeto")
-                    continue
-                if 'name' not in col or not col['name']:
-                    errors.append(f"Columna {i+1}: 'name' es requerido")
-                if 'type' in col and col['type'] not in ('TEXT', 'URL'):
-                    errors.append(f"Columna {i+1}: type debe ser 'TEXT' o 'URL'")
-
-        # Validar table_data
-        table_data = data['table_data']
-        if not isinstance(table_data, list):
-            errors.append("table_data debe ser un array")
-        elif len(table_data) == 0:
-            errors.append("table_data no puede estar vacío")
-        elif len(table_data) > 100:
-            errors.append("table_data: máximo 100 filas")
-        else:
-            # Validar que cada fila sea un array
-            for i, row in enumerate(table_data):
-                if not isinstance(row, list):
-                    errors.append(f"Fila {i+1} debe ser un array")
-
-        return errors
+        try:
+            _generated_validate(data)
+        except GeneratedSchemaError as e:
+            return [f"Estructura inválida: {e.message}"]
+        return []
 
     @staticmethod
     def get_validation_summary(result: TableValidationResult) -> str:
@@ -277,3 +364,146 @@ class AITableJSONValidator:
                 summary += f"  - {error}\n"
 
         return summary
+
+
+def _compile_schema_check(schema: Dict[str, Any]) -> Optional[Callable[[Any], Optional[str]]]:
+    """
+    Compila el schema una sola vez y retorna la función de validación.
+
+    Usa fastjsonschema si está disponible; si no, un Draft7Validator cuyo
+    meta-schema se verifica solo aquí.
+
+    Args:
+        schema: JSON Schema a compilar
+
+    Returns:
+        Función que recibe el documento y retorna el mensaje del primer error
+        (o None si es válido), o None si no hay librería de validación disponible
+    """
+    if FASTJSONSCHEMA_AVAILABLE:
+        validate = fastjsonschema.compile(schema)
+
+        def check(data: Any) -> Optional[str]:
+            try:
+                validate(data)
+            except fastjsonschema.JsonSchemaException as e:
+                return e.message
+            return None
+
+        return check
+
+    if JSONSCHEMA_AVAILABLE:
+        Draft7Validator.check_schema(schema)
+        validator = Draft7Validator(schema)
+
+        def check(data: Any) -> Optional[str]:
+            error = next(validator.iter_errors(data), None)
+            return error.message if error is not None else None
+
+        return check
+
+    return None
+
+
+def _scan_json_events(
+    events: Iterator[Tuple[str, Any]]
+) -> Optional[Tuple[Dict[str, Any], List[int], int]]:
+    """
+    Recorre los eventos de ijson.basic_parse de un documento de tabla IA.
+
+    Construye las claves de primer nivel salvo table_data, de la que solo
+    cuenta celdas por fila y celdas con datos.
+
+    Args:
+        events: Iterador de eventos (event, value) de ijson.basic_parse
+
+    Returns:
+        (documento sin table_data, celdas por fila, celdas con datos), o None si
+        el documento no es un objeto o table_data no cumple el schema
+
+    Raises:
+        ijson.JSONError: Si el JSON es sintácticamente inválido
+    """
+    if next(events, None) != ('start_map', None):
+        return None
+
+    data = {}
+    rows = None
+    for event, key in events:
+        if event == 'end_map':
+            break
+        if key in data or (key == 'table_data' and rows is not None):
+            # Clave duplicada: se deja la semántica exacta al parseo completo
+            return None
+        if key == 'table_data':
+            rows = _scan_table_data_events(events)
+            if rows is None:
+                return None
+        else:
+            data[key] = _build_json_value(events)
+
+    # Consumir el resto: ijson falla si hay contenido tras el objeto
+    for _ in events:
+        pass
+
+    if rows is None:
+        return None
+    return data, rows[0], rows[1]
+
+
+def _scan_table_data_events(events: Iterator[Tuple[str, Any]]) -> Optional[Tuple[List[int], int]]:
+    """
+    Cuenta las celdas de table_data a partir de sus eventos, sin construir filas.
+
+    Returns:
+        (celdas por fila, celdas con datos), o None en cuanto table_data deja
+        de cumplir el schema (array de 1 a _MAX_ROWS arrays de strings)
+    """
+    if next(events, None) != ('start_array', None):
+        return None
+
+    row_lengths = []
+    filled_count = 0
+    for event, _ in events:
+        if event == 'end_array':
+            break
+        if event != 'start_array' or len(row_lengths) == _MAX_ROWS:
+            return None
+
+        cells = 0
+        for event, value in events:
+            if event == 'string':
+                cells += 1
+                if value and not value.isspace():
+                    filled_count += 1
+            elif event == 'end_array':
+                break
+            else:
+                return None
+        row_lengths.append(cells)
+
+    if not row_lengths:
+        return None
+    return row_lengths, filled_count
+
+
+def _build_json_value(events: Iterator[Tuple[str, Any]]) -> Any:
+    """Construye el siguiente valor JSON completo a partir de los eventos."""
+    builder = ijson.ObjectBuilder()
+    depth = 0
+    for event, value in events:
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+        if depth == 0:
+            break
+    return builder.value
+
+
+# Máximo de filas de table_data según el schema
+_MAX_ROWS = AITableJSONValidator.SCHEMA['properties']['table_data']['maxItems']
+
+# Validador del schema de tablas IA, compilado al importar el módulo
+_check_schema = _compile_schema_check(AITableJSONValidator.SCHEMA)
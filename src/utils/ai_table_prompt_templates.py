@@ -7,7 +7,8 @@ para obtener JSON estructurado con datos de tablas.
 ACTUALIZADO: Ahora usa configuración manual de columnas (sin auto-detección)
 """
 import json
-from typing import Dict
+import string
+from typing import Any, Dict, Tuple
 
 
 class AITablePromptTemplate:
@@ -100,70 +101,57 @@ IMPORTANTE: Responde SOLO con el JSON válido, sin explicaciones antes o despué
         columns_config = config.get('columns_config', [])
         expected_cols = config.get('expected_cols', len(columns_config))
 
-        # Generar definición de columnas para el JSON
+        # Generar definición, detalles, reglas y fila de ejemplo en una sola pasada
         columns_definition = []
+        columns_details = []
+        column_type_rules = []
+        data_example_values = []
+        last_index = len(columns_config) - 1
+
         for i, col in enumerate(columns_config):
-            col_type = "URL" if col.get('is_url', False) else "TEXT"
-            is_sensitive = str(col.get('is_sensitive', False)).lower()
+            name = col['name']
+            is_url = col.get('is_url', False)
+            is_sens = col.get('is_sensitive', False)
+            col_type = "URL" if is_url else "TEXT"
 
+            # Definición de columna para el JSON
             col_def = f"""      {{
-        "name": "{col['name']}",
+        "name": "{name}",
         "type": "{col_type}",
-        "is_sensitive": {is_sensitive},
-        "description": "Descripción de {col['name']}"
+        "is_sensitive": {str(is_sens).lower()},
+        "description": "Descripción de {name}"
       }}"""
-            if i < len(columns_config) - 1:
+            if i < last_index:
                 col_def += ","
             columns_definition.append(col_def)
 
-        columns_definition_str = "\n".join(columns_definition)
-
-        # Generar detalles de columnas
-        columns_details = []
-        for i, col in enumerate(columns_config):
-            col_name = col['name']
-            col_type = "URL" if col.get('is_url', False) else "TEXT"
-            is_sensitive = col.get('is_sensitive', False)
-
-            details = f"  Columna {i+1}: '{col_name}'"
+            # Detalles de columna
+            details = f"  Columna {i+1}: '{name}'"
             details += f" (Tipo: {col_type}"
-
-            if is_sensitive:
+            if is_sens:
                 details += ", SENSIBLE - debe contener datos secretos"
             details += ")"
-
             columns_details.append(details)
 
-        columns_details_str = "\n".join(columns_details)
-
-        # Generar reglas de tipo de datos por columna
-        column_type_rules = []
-        for i, col in enumerate(columns_config):
-            col_name = col['name']
-            if col.get('is_url', False):
-                rule = f"   - '{col_name}': URLs válidas (ej: https://example.com)"
-            elif col.get('is_sensitive', False):
-                rule = f"   - '{col_name}': Datos apropiados para este campo (se marcarán como sensibles y se cifrarán)"
-            else:
-                rule = f"   - '{col_name}': Texto apropiado para este campo"
-
-            column_type_rules.append(rule)
-
-        column_type_rules_str = "\n".join(column_type_rules)
-
-        # Generar ejemplo de fila
-        data_example_values = []
-        for col in columns_config:
-            if col.get('is_url', False):
+            # Regla de tipo de datos y valor de ejemplo
+            if is_url:
+                column_type_rules.append(f"   - '{name}': URLs válidas (ej: https://example.com)")
                 data_example_values.append('"https://example.com"')
             else:
+                if is_sens:
+                    column_type_rules.append(f"   - '{name}': Datos apropiados para este campo (se marcarán como sensibles y se cifrarán)")
+                else:
+                    column_type_rules.append(f"   - '{name}': Texto apropiado para este campo")
                 # Para columnas sensibles y normales, usar el nombre como guía
-                data_example_values.append(f'"{col["name"]} ejemplo"')
+                data_example_values.append(f'"{name} ejemplo"')
 
+        columns_definition_str = "\n".join(columns_definition)
+        columns_details_str = "\n".join(columns_details)
+        column_type_rules_str = "\n".join(column_type_rules)
         data_example = "[" + ", ".join(data_example_values) + "]"
 
         # Formatear el prompt con todos los valores
-        prompt = AITablePromptTemplate.MAIN_TEMPLATE.format(
+        prompt = _render_main_template(
             table_name=config.get('table_name', 'MiTabla'),
             category_id=config.get('category_id', 1),
             category_name=config.get('category_name', 'General'),
@@ -208,3 +196,38 @@ IMPORTANTE: Responde SOLO con el JSON válido, sin explicaciones antes o despué
     ["valor_col1", "valor_col2", "..."]
   ]
 }"""
+
+
+def _split_template(template: str) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+    """
+    Separa un template de str.format en literales y campos (nombre, formato).
+
+    Retorna N+1 literales para N campos, de modo que el texto final es
+    literal[0] + campo[0] + literal[1] + ... + literal[N].
+    """
+    literals = []
+    fields = []
+    literal = ''
+    for text, field_name, format_spec, conversion in string.Formatter().parse(template):
+        literal += text
+        if field_name is not None:
+            if conversion is not None:
+                raise ValueError(f"Conversión no soportada en campo '{field_name}'")
+            literals.append(literal)
+            fields.append((field_name, format_spec))
+            literal = ''
+    literals.append(literal)
+    return tuple(literals), tuple(fields)
+
+
+# MAIN_TEMPLATE separado una sola vez al importar el módulo
+_MAIN_LITERALS, _MAIN_FIELDS = _split_template(AITablePromptTemplate.MAIN_TEMPLATE)
+
+
+def _render_main_template(**values: Any) -> str:
+    """Equivale a MAIN_TEMPLATE.format(**values) sin volver a analizar el template."""
+    parts = [_MAIN_LITERALS[0]]
+    for (name, format_spec), literal in zip(_MAIN_FIELDS, _MAIN_LITERALS[1:]):
+        parts.append(format(values[name], format_spec))
+        parts.append(literal)
+    return ''.join(parts)
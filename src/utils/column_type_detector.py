@@ -7,36 +7,71 @@ Detecta automáticamente:
 """
 import re
 import logging
-from typing import List, Dict
+from itertools import zip_longest
+from typing import List, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Clases de caracteres para la detección por patrón en celdas no ASCII (una
+# búsqueda en C por celda, que se detiene en la primera coincidencia). Son
+# Unicode como isdigit/isalpha; solo difieren en numerales no decimales (², ½...)
+_HAS_DIGIT = re.compile(r'\d').search
+_HAS_ALPHA = re.compile(r'[^\W\d_]').search
+_HAS_SPECIAL = re.compile(r'[^\w \-]').search  # ni alfanumérico ni ' ', '-', '_'
+
+# Para celdas ASCII (el caso habitual): clase de cada byte (1 dígito, 2 letra,
+# 4 especial, 0 para ' ', '-', '_'); un solo bytes.translate clasifica la celda
+_ASCII_CLASS_TABLE = bytes(
+    1 if c.isdigit() else 2 if c.isalpha() else 0 if c in ' -_' else 4
+    for c in map(chr, range(128))
+) + bytes(128)
+
 
 class ColumnTypeDetector:
     """Detección automática de tipos y características de columnas."""
 
     # Palabras clave para detección de datos sensibles
-    SENSITIVE_KEYWORDS = [
+    SENSITIVE_KEYWORDS = (
         'password', 'pass', 'pwd', 'contraseña', 'clave',
         'api_key', 'apikey', 'api-key', 'token', 'secret', 'secreto',
         'cvv', 'pin', 'ssn', 'credit_card', 'tarjeta',
         'private_key', 'private-key', 'auth', 'credential',
         'secret_key', 'access_token', 'refresh_token'
-    ]
+    )
+
+    # Todas las palabras clave en una sola alternancia compilada (sin distinguir mayúsculas)
+    _SENSITIVE_RE = re.compile('|'.join(map(re.escape, SENSITIVE_KEYWORDS)), re.IGNORECASE)
 
-    # Patrones regex para URLs y emails
-    URL_PATTERNS = [
+    # Patrones regex para URLs y emails (se buscan con search(), que ya prueba
+    # cada posición: un prefijo '.*' no cambia el resultado y solo añade retroceso)
+    URL_PATTERNS = (
         r'https?://',
         r'www\.',
-        r'.*\.com',
-        r'.*\.org',
-        r'.*\.net',
-        r'.*\.io',
-        r'.*\.dev',
-        r'.*@.*\.',  # emails
+        r'\.com',
+        r'\.org',
+        r'\.net',
+        r'\.io',
+        r'\.dev',
+        r'@.*\.',  # emails
         r'ftp://',
         r'mailto:',
-    ]
+    )
+
+    # Todos los patrones en una sola alternancia compilada (sin distinguir mayúsculas)
+    _URL_RE = re.compile('|'.join(URL_PATTERNS), re.IGNORECASE)
+
+    @staticmethod
+    def _is_url_like(text: str) -> bool:
+        """
+        Indica si un valor coincide con alguno de URL_PATTERNS.
+
+        Todos los patrones contienen '.', ':' o '@', así que un valor sin
+        ninguno de ellos (el caso habitual en columnas de texto) se descarta
+        sin ejecutar el regex, que probaría la alternancia en cada posición.
+        """
+        if '.' not in text and ':' not in text and '@' not in text:
+            return False
+        return ColumnTypeDetector._URL_RE.search(text) is not None
 
     @staticmethod
     def detect_url_column(column_data: List[str], threshold: float = 0.7) -> bool:
@@ -63,21 +98,15 @@ class ColumnTypeDetector:
         if not non_empty:
             return False
 
-        matches = 0
-        for cell in non_empty:
-            if not isinstance(cell, str):
-                continue
-
-            cell_lower = cell.lower().strip()
-
-            # Verificar contra patrones
-            for pattern in ColumnTypeDetector.URL_PATTERNS:
-                if re.search(pattern, cell_lower):
-                    matches += 1
-                    break
+        # Verificar contra patrones (una búsqueda por celda)
+        is_url_like = ColumnTypeDetector._is_url_like
+        matches = sum(
+            1 for cell in non_empty
+            if isinstance(cell, str) and is_url_like(cell)
+        )
 
         match_ratio = matches / len(non_empty) if non_empty else 0
-        logger.debug(f"URL detection: {matches}/{len(non_empty)} = {match_ratio:.2%}")
+        logger.debug("URL detection: %d/%d = %.2f%%", matches, len(non_empty), match_ratio * 100)
 
         return match_ratio >= threshold
 
@@ -109,11 +138,11 @@ class ColumnTypeDetector:
             True
         """
         # 1. Detectar por nombre de columna
-        column_name_lower = column_name.lower()
-        for keyword in ColumnTypeDetector.SENSITIVE_KEYWORDS:
-            if keyword in column_name_lower:
-                logger.info(f"Column '{column_name}' detected as sensitive (keyword: '{keyword}')")
-                return True
+        keyword_match = ColumnTypeDetector._SENSITIVE_RE.search(column_name)
+        if keyword_match:
+            keyword = keyword_match.group(0).lower()
+            logger.info("Column '%s' detected as sensitive (keyword: '%s')", column_name, keyword)
+            return True
 
         # 2. Detectar por patrón de datos
         if not column_data:
@@ -128,31 +157,113 @@ class ColumnTypeDetector:
         # - Longitud entre 6 y 64 caracteres
         # - Mix de letras y números
         # - Puede tener caracteres especiales
-        password_like_count = 0
         sample_size = min(len(non_empty), 10)  # Solo primeras 10 muestras
-
-        for cell in non_empty[:sample_size]:
-            if 6 <= len(cell) <= 64:
-                has_digit = any(c.isdigit() for c in cell)
-                has_alpha = any(c.isalpha() for c in cell)
-                has_special = any(not c.isalnum() and c not in (' ', '-', '_') for c in cell)
-
-                # Si tiene mix de tipos de caracteres, probablemente sea sensible
-                char_types = sum([has_digit, has_alpha, has_special])
-                if char_types >= 2:
-                    password_like_count += 1
+        password_like_count = sum(
+            map(ColumnTypeDetector._is_password_like, non_empty[:sample_size])
+        )
 
         pattern_ratio = password_like_count / sample_size if sample_size > 0 else 0
 
         if pattern_ratio >= threshold:
             logger.info(
-                f"Column '{column_name}' detected as sensitive "
-                f"(pattern match: {pattern_ratio:.2%})"
+                "Column '%s' detected as sensitive (pattern match: %.2f%%)",
+                column_name, pattern_ratio * 100
             )
             return True
 
         return False
 
+    @staticmethod
+    def _is_password_like(text: str) -> bool:
+        """
+        Indica si un valor (ya sin espacios al inicio/final) parece password/key.
+
+        Características típicas de passwords/keys:
+        - Longitud entre 6 y 64 caracteres
+        - Mix de al menos dos tipos: dígitos, letras, caracteres especiales
+        """
+        if not 6 <= len(text) <= 64:
+            return False
+        if text.isascii():
+            classes = text.encode('ascii').translate(_ASCII_CLASS_TABLE)
+            char_types = (1 in classes) + (2 in classes) + (4 in classes)
+        else:
+            char_types = (
+                (_HAS_DIGIT(text) is not None)
+                + (_HAS_ALPHA(text) is not None)
+                + (_HAS_SPECIAL(text) is not None)
+            )
+        return char_types >= 2
+
+    @staticmethod
+    def _analyze_column(
+        column_name: str,
+        column_data: List[str],
+        detect_url: bool = True,
+        detect_sensitive: bool = True,
+        url_threshold: float = 0.7,
+        sensitive_threshold: float = 0.5
+    ) -> Tuple[bool, bool]:
+        """
+        Detección de URL y de datos sensibles en un solo recorrido de la columna.
+
+        Equivale a detect_url_column + detect_sensitive_column con los mismos
+        umbrales, pero cada celda se filtra y examina una sola vez.
+
+        Returns:
+            Tuple (is_url, is_sensitive)
+        """
+        keyword_match = None
+        if detect_sensitive:
+            keyword_match = ColumnTypeDetector._SENSITIVE_RE.search(column_name)
+            if keyword_match:
+                keyword = keyword_match.group(0).lower()
+                logger.info("Column '%s' detected as sensitive (keyword: '%s')", column_name, keyword)
+
+        check_url = detect_url
+        check_pattern = detect_sensitive and keyword_match is None
+        if not (check_url or check_pattern):
+            return False, keyword_match is not None
+
+        is_url_like = ColumnTypeDetector._is_url_like
+        is_password_like = ColumnTypeDetector._is_password_like
+        non_empty_count = url_matches = sample_size = password_like_count = 0
+
+        for cell in column_data:
+            if not cell:
+                continue
+            text = (cell if isinstance(cell, str) else str(cell)).strip()
+            if not text:
+                continue
+            non_empty_count += 1
+
+            if check_url and isinstance(cell, str) and is_url_like(cell):
+                url_matches += 1
+
+            # Patrón de datos: solo las primeras 10 muestras no vacías
+            if check_pattern and sample_size < 10:
+                sample_size += 1
+                if is_password_like(text):
+                    password_like_count += 1
+
+        is_url = False
+        if check_url and non_empty_count:
+            match_ratio = url_matches / non_empty_count
+            logger.debug("URL detection: %d/%d = %.2f%%", url_matches, non_empty_count, match_ratio * 100)
+            is_url = match_ratio >= url_threshold
+
+        is_sensitive = keyword_match is not None
+        if check_pattern and sample_size:
+            pattern_ratio = password_like_count / sample_size
+            if pattern_ratio >= sensitive_threshold:
+                logger.info(
+                    "Column '%s' detected as sensitive (pattern match: %.2f%%)",
+                    column_name, pattern_ratio * 100
+                )
+                is_sensitive = True
+
+        return is_url, is_sensitive
+
     @staticmethod
     def auto_detect_column_types(
         columns: List[Dict],
@@ -170,7 +281,8 @@ class ColumnTypeDetector:
             enable_sensitive_detection: Habilitar detección de sensibles
 
         Returns:
-            Lista de columnas con tipos detectados y actualizados
+            Lista de columnas con tipos detectados y actualizados (las columnas
+            modificadas son copias; si no se detectó nada se retorna `columns`)
 
         Example:
             >>> columns = [
@@ -192,46 +304,54 @@ class ColumnTypeDetector:
             return columns
 
         updated_columns = []
+        changed = False
         detections = {
             'url': 0,
             'sensitive': 0
         }
 
+        # Transponer una sola vez a columnas (filas cortas se rellenan con '')
+        columns_data = list(zip_longest(*table_data, fillvalue=''))
+        empty_column = ('',) * len(table_data)
+
         for col_idx, column in enumerate(columns):
-            # Crear copia para no modificar original
-            updated_col = column.copy()
+            # Datos de esta columna
+            column_data = columns_data[col_idx] if col_idx < len(columns_data) else empty_column
+
+            # Detectar URL y sensible en un solo recorrido de la columna
+            is_url, is_sensitive = ColumnTypeDetector._analyze_column(
+                column['name'],
+                column_data,
+                detect_url=enable_url_detection,
+                detect_sensitive=enable_sensitive_detection
+            )
 
-            # Extraer datos de esta columna
-            column_data = []
-            for row in table_data:
-                if col_idx < len(row):
-                    column_data.append(row[col_idx])
-                else:
-                    column_data.append('')
+            # Copiar solo si hay algo que cambiar (no modificar el original)
+            updated_col = column
+            if is_url or is_sensitive:
+                updated_col = column.copy()
+                changed = True
 
             # Detectar URL
-            if enable_url_detection and ColumnTypeDetector.detect_url_column(column_data):
+            if is_url:
                 updated_col['type'] = 'URL'
                 detections['url'] += 1
-                logger.debug(f"Column {col_idx} ('{column['name']}') detected as URL")
+                logger.debug("Column %d ('%s') detected as URL", col_idx, column['name'])
 
             # Detectar sensible
-            if enable_sensitive_detection and ColumnTypeDetector.detect_sensitive_column(
-                column['name'],
-                column_data
-            ):
+            if is_sensitive:
                 updated_col['is_sensitive'] = True
                 detections['sensitive'] += 1
-                logger.debug(f"Column {col_idx} ('{column['name']}') detected as sensitive")
+                logger.debug("Column %d ('%s') detected as sensitive", col_idx, column['name'])
 
             updated_columns.append(updated_col)
 
         logger.info(
-            f"Auto-detected types for {len(updated_columns)} columns: "
-            f"{detections['url']} URLs, {detections['sensitive']} sensitive"
+            "Auto-detected types for %d columns: %d URLs, %d sensitive",
+            len(updated_columns), detections['url'], detections['sensitive']
         )
 
-        return updated_columns
+        return updated_columns if changed else columns
 
     @staticmethod
     def get_detection_summary(
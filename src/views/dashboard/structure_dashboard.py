@@ -538,6 +538,20 @@ class StructureDashboard(QDialog, TaskbarMinimizableMixin):
         tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         tree.customContextMenuRequested.connect(self.show_context_menu)
 
+        # Revision read by the tags sidebar to skip walking an unchanged tree.
+        # Model signals cover item inserts/removals/edits; visibility changes
+        # (setHidden) bump it explicitly
+        tree.tags_revision = 0
+
+        def bump_tags_revision(*args):
+            tree.tags_revision += 1
+
+        model = tree.model()
+        model.rowsInserted.connect(bump_tags_revision)
+        model.rowsRemoved.connect(bump_tags_revision)
+        model.modelReset.connect(bump_tags_revision)
+        model.dataChanged.connect(bump_tags_revision)
+
         return tree
 
     def create_footer(self) -> QWidget:
@@ -2175,16 +2189,18 @@ class StructureDashboard(QDialog, TaskbarMinimizableMixin):
 
         logger.info(f"Search found {len(matches)} matches")
 
-    def _on_tags_filter_changed(self, selected_tags: list):
+    def _on_tags_filter_changed(self, selected_tags: frozenset):
         """
         Filter tree items based on selected tags
 
         Args:
-            selected_tags: List of tag names that are currently selected
+            selected_tags: frozenset of tag names that are currently selected
+                (an item is shown if it has any of them)
         """
         logger.info(f"Filtering tree by {len(selected_tags)} selected tags")
 
         root = self.tree_widget.invisibleRootItem()
+        self.tree_widget.tags_revision += 1
 
         # If no tags selected, hide all items
         if not selected_tags:
@@ -2199,7 +2215,7 @@ class StructureDashboard(QDialog, TaskbarMinimizableMixin):
             logger.debug("No tags selected, hiding all items")
             return
 
-        # Filter items by selected tags
+        # Filter items by selected tags (hashed lookup per item tag)
         for cat_idx in range(root.childCount()):
             category_item = root.child(cat_idx)
             visible_items_count = 0
@@ -2227,7 +2243,7 @@ class StructureDashboard(QDialog, TaskbarMinimizableMixin):
                     item_tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
 
                 # Show item if it has at least one selected tag
-                has_selected_tag = any(tag in selected_tags for tag in item_tags)
+                has_selected_tag = not selected_tags.isdisjoint(item_tags)
                 item_widget.setHidden(not has_selected_tag)
 
                 if has_selected_tag:
@@ -2240,7 +2256,7 @@ class StructureDashboard(QDialog, TaskbarMinimizableMixin):
             if visible_items_count > 0:
                 category_item.setExpanded(True)
 
-        logger.debug(f"Tag filtering applied: {selected_tags}")
+        logger.debug(f"Tag filtering applied: {sorted(selected_tags)}")
 
     def clear_highlighting(self):
         """Clear all highlighting in tree"""
@@ -2293,6 +2309,7 @@ class StructureDashboard(QDialog, TaskbarMinimizableMixin):
     def show_all_items(self):
         """Show all items in tree"""
         root = self.tree_widget.invisibleRootItem()
+        self.tree_widget.tags_revision += 1
 
         for cat_idx in range(root.childCount()):
             category_item = root.child(cat_idx)
@@ -2351,6 +2368,7 @@ class StructureDashboard(QDialog, TaskbarMinimizableMixin):
             matches: List of (match_type, category_index, item_index) tuples
         """
         root = self.tree_widget.invisibleRootItem()
+        self.tree_widget.tags_revision += 1
 
         # Create set of matching category and item indices for quick lookup
         matching_categories = set()
@@ -2,23 +2,154 @@
 Tags Filter Sidebar Widget - Panel lateral de filtro por tags para Dashboard de Estructura
 """
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QScrollArea, QCheckBox, QPushButton, QFrame
+    QWidget, QVBoxLayout, QLabel, QListView, QAbstractItemView, QPushButton, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, pyqtSignal
+from bisect import bisect_left
+from collections import deque
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _parse_tags(tags_str):
+    """Split a comma-separated tags string into a frozenset of clean tags"""
+    return frozenset(tag for tag in map(str.strip, tags_str.split(',')) if tag)
+
+
+class TagsListModel(QAbstractListModel):
+    """Checkable, alphabetically sorted list of tags for the tags filter view"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tags = []  # Sorted tag names (one row each)
+        self._checked = set()  # Checked tag names
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tags)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        tag = self._tags[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"🏷️  {tag}"
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if tag in self._checked else Qt.CheckState.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        tag = self._tags[index.row()]
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self._checked.add(tag)
+        else:
+            self._checked.discard(tag)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+
+    def set_tags(self, tags):
+        """
+        Replace the tag set. Rows of surviving tags (and their checked state)
+        are kept; new tags start checked
+
+        Returns:
+            Tuple (added count, removed count)
+        """
+        current = set(self._tags)
+        removed = current - tags
+        added = tags - current
+
+        if len(added) + len(removed) > len(self._tags) // 2:
+            # Mostly new content: one reset is cheaper than many row signals
+            self.beginResetModel()
+            self._tags = sorted(tags)
+            self._checked = (self._checked - removed) | added
+            self.endResetModel()
+            return len(added), len(removed)
+
+        parent = QModelIndex()
+        for tag in removed:
+            row = bisect_left(self._tags, tag)
+            self.beginRemoveRows(parent, row, row)
+            del self._tags[row]
+            self._checked.discard(tag)
+            self.endRemoveRows()
+
+        for tag in sorted(added):
+            row = bisect_left(self._tags, tag)
+            self.beginInsertRows(parent, row, row)
+            self._tags.insert(row, tag)
+            self._checked.add(tag)
+            self.endInsertRows()
+
+        return len(added), len(removed)
+
+    def set_all_checked(self, checked):
+        """
+        Check or uncheck every tag with a single dataChanged signal
+
+        Returns:
+            True if any tag changed state
+        """
+        new_checked = set(self._tags) if checked else set()
+        changed = new_checked ^ self._checked
+        if not changed:
+            return False
+        self._checked = new_checked
+        # Report only the span of rows that actually changed, so the view
+        # repaints those rows instead of the whole viewport
+        first = bisect_left(self._tags, min(changed))
+        last = bisect_left(self._tags, max(changed))
+        self.dataChanged.emit(
+            self.index(first), self.index(last),
+            [Qt.ItemDataRole.CheckStateRole]
+        )
+        return True
+
+    def checked_tags(self):
+        """Get checked tags in alphabetical order"""
+        # Sorting the checked set is O(k log k); no scan over every row
+        return sorted(self._checked)
+
+    def checked_set(self):
+        """Get checked tags as a frozenset"""
+        return frozenset(self._checked)
+
+    def clear(self):
+        """Remove all tags"""
+        self.beginResetModel()
+        self._tags = []
+        self._checked = set()
+        self.endResetModel()
+
+
 class TagsFilterSidebar(QWidget):
     """Panel lateral de filtro dinámico por tags para Dashboard"""
 
-    tags_filter_changed = pyqtSignal(list)  # List of selected tags
+    tags_filter_changed = pyqtSignal(object)  # frozenset of selected tags
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.tag_checkboxes = {}  # tag_name -> QCheckBox
         self.available_tags = set()  # Tags from current results
+        self._pressed_check_state = None  # Check state of the row under the mouse press
+        self._last_tree_rev = None  # tree_widget.tags_revision of the last walk
+
+        # Timer to coalesce bursts of update_tags_from_tree calls
+        self._pending_tree = None
+        self._debounce_ms = 80
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.timeout.connect(self._flush_tags_update)
+
         self.init_ui()
 
     def init_ui(self):
@@ -76,13 +207,61 @@ class TagsFilterSidebar(QWidget):
         separator.setStyleSheet("background-color: #3a3a3a; max-height: 1px;")
         content_layout.addWidget(separator)
 
-        # Scroll area for tag checkboxes
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
+        # Empty state
+        self.empty_label = QLabel("No hay tags disponibles\n\nLos tags aparecerán\nautomáticamente al\nbuscar items")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setStyleSheet("""
+            QLabel {
+                color: #666666;
+                font-size: 11px;
+                padding: 40px 10px;
+                background-color: transparent;
+            }
+        """)
+        content_layout.addWidget(self.empty_label, 1, Qt.AlignmentFlag.AlignTop)
+
+        # Tag list: a view over a checkable model, so only visible rows are
+        # painted and no widget is created per tag
+        self.tags_model = TagsListModel(self)
+        self.tags_model.dataChanged.connect(self._on_tag_checkbox_changed)
+
+        self.tags_view = QListView()
+        self.tags_view.setModel(self.tags_model)
+        self.tags_view.setUniformItemSizes(True)
+        self.tags_view.setSpacing(3)
+        self.tags_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.tags_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.tags_view.pressed.connect(self._on_tag_pressed)
+        self.tags_view.clicked.connect(self._on_tag_clicked)
+        self.tags_view.setStyleSheet("""
+            QListView {
                 background-color: transparent;
                 border: none;
+                color: #ffffff;
+                font-size: 11px;
+                outline: 0;
+            }
+            QListView::item {
+                padding: 5px 8px;
+                background-color: #252525;
+                border-radius: 4px;
+            }
+            QListView::item:hover {
+                background-color: #2a2a2a;
+            }
+            QListView::indicator {
+                width: 14px;
+                height: 14px;
+                border: 2px solid #3a3a3a;
+                border-radius: 3px;
+                background-color: #1e1e1e;
+            }
+            QListView::indicator:checked {
+                background-color: #f093fb;
+                border-color: #f093fb;
+            }
+            QListView::indicator:hover {
+                border-color: #f093fb;
             }
             QScrollBar:vertical {
                 background-color: #1e1e1e;
@@ -101,29 +280,8 @@ class TagsFilterSidebar(QWidget):
                 height: 0px;
             }
         """)
-
-        # Container for tag checkboxes
-        self.tags_container = QWidget()
-        self.tags_layout = QVBoxLayout(self.tags_container)
-        self.tags_layout.setContentsMargins(0, 5, 0, 5)
-        self.tags_layout.setSpacing(6)
-
-        # Empty state
-        self.empty_label = QLabel("No hay tags disponibles\n\nLos tags aparecerán\nautomáticamente al\nbuscar items")
-        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.empty_label.setStyleSheet("""
-            QLabel {
-                color: #666666;
-                font-size: 11px;
-                padding: 40px 10px;
-                background-color: transparent;
-            }
-        """)
-        self.tags_layout.addWidget(self.empty_label)
-        self.tags_layout.addStretch()
-
-        scroll.setWidget(self.tags_container)
-        content_layout.addWidget(scroll, 1)
+        self.tags_view.setVisible(False)
+        content_layout.addWidget(self.tags_view, 1)
 
         # Action buttons
         buttons_layout = QVBoxLayout()
@@ -186,59 +344,84 @@ class TagsFilterSidebar(QWidget):
         layout.addLayout(content_layout)
 
     def update_tags_from_tree(self, tree_widget):
+        """
+        Schedule a tags update from visible tree items
+
+        Calls within the debounce window are coalesced: only the last tree
+        given is walked, once, when the timer fires.
+
+        Args:
+            tree_widget: QTreeWidget with structure data
+        """
+        self._pending_tree = tree_widget
+        if not self.update_timer.isActive():
+            self.update_timer.start(self._debounce_ms)
+
+    def _flush_tags_update(self):
+        """Run the pending tags update (after debounce)"""
+        tree_widget, self._pending_tree = self._pending_tree, None
+        if tree_widget is not None:
+            self._do_update_tags_from_tree(tree_widget)
+
+    def _do_update_tags_from_tree(self, tree_widget):
         """
         Extract unique tags from visible tree items
 
         Args:
             tree_widget: QTreeWidget with structure data
         """
+        # Skip the walk if the tree's owner reports no change since the last one
+        rev = getattr(tree_widget, 'tags_revision', None)
+        if rev is not None and rev == self._last_tree_rev:
+            logger.debug("Tree unchanged, skipping tags update")
+            return
+
         logger.info("Updating tags filter from tree widget")
 
-        # Extract unique tags from all visible items
+        # Extract unique tags from all visible items (iterative walk; a hidden
+        # item prunes its whole subtree)
         new_tags = set()
+        add_tags = new_tags.update
+        tags_of = self._tags_of
+        user_role = Qt.ItemDataRole.UserRole
+
+        root = tree_widget.invisibleRootItem()
+        pending = deque(root.child(i) for i in range(root.childCount()))
+        push = pending.append
 
-        def collect_tags_recursive(item):
-            """Recursively collect tags from item and its children"""
+        while pending:
+            item = pending.popleft()
             # Check if item is hidden (filtered out)
             if item.isHidden():
-                return
+                continue
 
-            # Get tags from item data
-            item_data = item.data(0, Qt.ItemDataRole.UserRole)
-            if item_data and isinstance(item_data, dict):
-                item_type = item_data.get('type')
-
-                # Only collect tags from actual items, not categories
-                if item_type == 'item':
-                    tags_str = item_data.get('tags', '')
-                    if tags_str:
-                        # Split tags and clean whitespace
-                        tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
-                        new_tags.update(tags)
+            # Only collect tags from actual items, not categories
+            item_data = item.data(0, user_role)
+            if item_data and isinstance(item_data, dict) and item_data.get('type') == 'item':
+                add_tags(tags_of(item_data))
 
             # Process children
             for i in range(item.childCount()):
-                collect_tags_recursive(item.child(i))
+                push(item.child(i))
 
-        # Collect from root level
-        root = tree_widget.invisibleRootItem()
-        for i in range(root.childCount()):
-            collect_tags_recursive(root.child(i))
+        self._last_tree_rev = rev
 
         # Only update if tags changed
         if new_tags == self.available_tags:
             logger.debug("Tags unchanged, skipping update")
             return
 
-        self.available_tags = new_tags
         logger.info(f"Found {len(new_tags)} unique tags")
 
-        # Clear existing checkboxes
-        self._clear_tag_checkboxes()
+        # Only rows of changed tags are touched; surviving tags keep their
+        # checked state
+        added, removed = self.tags_model.set_tags(new_tags)
+        self.available_tags = new_tags
 
         if not new_tags:
             # Show empty state
             self.empty_label.setVisible(True)
+            self.tags_view.setVisible(False)
             self.select_all_btn.setEnabled(False)
             self.deselect_all_btn.setEnabled(False)
             self.tag_count_label.setText("(0 tags)")
@@ -246,84 +429,76 @@ class TagsFilterSidebar(QWidget):
 
         # Hide empty state
         self.empty_label.setVisible(False)
+        self.tags_view.setVisible(True)
         self.select_all_btn.setEnabled(True)
         self.deselect_all_btn.setEnabled(True)
 
-        # Create checkbox for each unique tag (sorted alphabetically)
-        for tag in sorted(new_tags):
-            checkbox = QCheckBox(f"🏷️  {tag}")
-            checkbox.setChecked(True)  # All tags selected by default
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    color: #ffffff;
-                    font-size: 11px;
-                    spacing: 5px;
-                    padding: 5px 8px;
-                    background-color: #252525;
-                    border-radius: 4px;
-                }
-                QCheckBox:hover {
-                    background-color: #2a2a2a;
-                }
-                QCheckBox::indicator {
-                    width: 14px;
-                    height: 14px;
-                    border: 2px solid #3a3a3a;
-                    border-radius: 3px;
-                    background-color: #1e1e1e;
-                }
-                QCheckBox::indicator:checked {
-                    background-color: #f093fb;
-                    border-color: #f093fb;
-                }
-                QCheckBox::indicator:hover {
-                    border-color: #f093fb;
-                }
-            """)
-            checkbox.stateChanged.connect(self._on_tag_checkbox_changed)
-
-            self.tag_checkboxes[tag] = checkbox
-            # Insert before stretch
-            self.tags_layout.insertWidget(self.tags_layout.count() - 1, checkbox)
-
         # Update count
         self.tag_count_label.setText(f"({len(new_tags)} tags)")
 
-        logger.info(f"Created {len(new_tags)} tag checkboxes")
+        logger.info(f"Tag list updated: {added} added, {removed} removed")
 
-    def _clear_tag_checkboxes(self):
-        """Remove all tag checkboxes"""
-        for checkbox in self.tag_checkboxes.values():
-            checkbox.deleteLater()
-        self.tag_checkboxes.clear()
+    @staticmethod
+    def _tags_of(item_data):
+        """
+        Get the set of tags of an item's UserRole data
+
+        The parsed set is cached by tags string: QTreeWidgetItem.data() returns
+        a fresh copy of the dict on every call, so it can't be stored on it.
+        """
+        tags_str = item_data.get('tags')
+        if not tags_str:
+            return frozenset()
+        return _parse_tags(tags_str)
+
+    def _on_tag_pressed(self, index):
+        """Remember the check state of the pressed row"""
+        self._pressed_check_state = index.data(Qt.ItemDataRole.CheckStateRole)
+
+    def _on_tag_clicked(self, index):
+        """Toggle a tag when its name (not only the indicator) is clicked"""
+        state = index.data(Qt.ItemDataRole.CheckStateRole)
+        if state != self._pressed_check_state:
+            return  # The view already toggled it from the indicator
+        new_state = (
+            Qt.CheckState.Unchecked if state == Qt.CheckState.Checked
+            else Qt.CheckState.Checked
+        )
+        self.tags_model.setData(index, new_state, Qt.ItemDataRole.CheckStateRole)
 
     def _on_tag_checkbox_changed(self):
-        """Handle tag checkbox state change"""
-        selected_tags = self.get_selected_tags()
+        """Handle tag check state change"""
+        selected_tags = self.get_selected_tags_set()
         logger.debug(f"Tags filter changed: {len(selected_tags)} tags selected")
         self.tags_filter_changed.emit(selected_tags)
 
     def _on_select_all(self):
-        """Select all tag checkboxes"""
-        for checkbox in self.tag_checkboxes.values():
-            checkbox.setChecked(True)
+        """Select all tags (one filter change for the whole list)"""
+        self.tags_model.set_all_checked(True)
         logger.info("All tags selected")
 
     def _on_deselect_all(self):
-        """Deselect all tag checkboxes"""
-        for checkbox in self.tag_checkboxes.values():
-            checkbox.setChecked(False)
+        """Deselect all tags (one filter change for the whole list)"""
+        self.tags_model.set_all_checked(False)
         logger.info("All tags deselected")
 
     def get_selected_tags(self):
         """Get list of currently selected tags"""
-        return [tag for tag, checkbox in self.tag_checkboxes.items() if checkbox.isChecked()]
+        return self.tags_model.checked_tags()
+
+    def get_selected_tags_set(self):
+        """Get currently selected tags as a frozenset (O(1) membership tests)"""
+        return self.tags_model.checked_set()
 
     def clear(self):
         """Clear all tags"""
-        self._clear_tag_checkboxes()
+        self.update_timer.stop()
+        self._pending_tree = None
+        self.tags_model.clear()
         self.available_tags.clear()
+        self._last_tree_rev = None
         self.empty_label.setVisible(True)
+        self.tags_view.setVisible(False)
         self.select_all_btn.setEnabled(False)
         self.deselect_all_btn.setEnabled(False)
         self.tag_count_label.setText("(0 tags)")
@@ -32,6 +32,43 @@ from views.widgets.ai_table_creation_step import AITableCreationStep
 
 logger = logging.getLogger(__name__)
 
+# Tema oscuro del wizard (se aplica una sola vez, con los hijos ya creados)
+_WIZARD_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #cccccc;
+    }
+    QLabel {
+        color: #cccccc;
+    }
+    QPushButton {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 10pt;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #3d3d3d;
+        border: 1px solid #007acc;
+    }
+    QPushButton:disabled {
+        background-color: #252525;
+        color: #666666;
+        border: 1px solid #2d2d2d;
+    }
+    QPushButton#next_button, QPushButton#finish_button {
+        background-color: #007acc;
+        color: #ffffff;
+        border: none;
+    }
+    QPushButton#next_button:hover, QPushButton#finish_button:hover {
+        background-color: #005a9e;
+    }
+"""
+
 
 class AITableCreatorWizard(QDialog):
     """
@@ -76,43 +113,6 @@ class AITableCreatorWizard(QDialog):
         self.setFixedSize(900, 750)
         self.setModal(True)
 
-        # Aplicar tema oscuro
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #cccccc;
-            }
-            QLabel {
-                color: #cccccc;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 10pt;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border: 1px solid #007acc;
-            }
-            QPushButton:disabled {
-                background-color: #252525;
-                color: #666666;
-                border: 1px solid #2d2d2d;
-            }
-            QPushButton#next_button, QPushButton#finish_button {
-                background-color: #007acc;
-                color: #ffffff;
-                border: none;
-            }
-            QPushButton#next_button:hover, QPushButton#finish_button:hover {
-                background-color: #005a9e;
-            }
-        """)
-
         # Layout principal
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(15)
@@ -139,6 +139,8 @@ class AITableCreatorWizard(QDialog):
         # Stepper visual
         self.stepper_label = QLabel()
         self.stepper_label.setStyleSheet("color: #00d4ff; font-family: monospace;")
+        # Solo hay un texto posible por paso: se generan una vez
+        self._stepper_texts = [self._compose_stepper(i) for i in range(self.total_steps)]
         self.update_stepper()
         main_layout.addWidget(self.stepper_label)
 
@@ -151,18 +153,17 @@ class AITableCreatorWizard(QDialog):
         # Stacked widget para los pasos
         self.stacked_widget = QStackedWidget()
 
-        # Crear steps
-        self.step1 = AITableConfigStep(self.db, self.controller, self)
-        self.step2 = AITablePromptStep(self)
-        self.step3 = AITableJSONStep(self.ai_manager, self)
-        self.step4 = AITablePreviewStep(self)
-        self.step5 = AITableCreationStep(self.ai_manager, self)
-
-        self.stacked_widget.addWidget(self.step1)
-        self.stacked_widget.addWidget(self.step2)
-        self.stacked_widget.addWidget(self.step3)
-        self.stacked_widget.addWidget(self.step4)
-        self.stacked_widget.addWidget(self.step5)
+        # Steps: se crean bajo demanda al llegar a cada uno (cancelar en el
+        # paso 1 no construye los demás)
+        self._steps = {}  # índice -> widget del paso
+        self._step_factories = [
+            lambda: AITableConfigStep(self.db, self.controller, self),
+            lambda: AITablePromptStep(self),
+            lambda: AITableJSONStep(self.ai_manager, self),
+            lambda: AITablePreviewStep(self),
+            lambda: AITableCreationStep(self.ai_manager, self),
+        ]
+        self._ensure_step(0)
 
         main_layout.addWidget(self.stacked_widget, 1)
 
@@ -194,13 +195,45 @@ class AITableCreatorWizard(QDialog):
 
         main_layout.addLayout(buttons_layout)
 
+        # Aplicar tema oscuro
+        self.setStyleSheet(_WIZARD_QSS)
+
+    def _ensure_step(self, index: int) -> QWidget:
+        """
+        Obtiene el widget de un paso, creándolo la primera vez.
+
+        Args:
+            index: Índice del paso (0-based)
+
+        Returns:
+            Widget del paso
+        """
+        step = self._steps.get(index)
+        if step is None:
+            step = self._step_factories[index]()
+            self._steps[index] = step
+            self.stacked_widget.insertWidget(index, step)
+        return step
+
     def update_stepper(self):
         """Actualiza el stepper visual."""
+        self.stepper_label.setText(self._stepper_texts[self.current_step])
+
+    def _compose_stepper(self, current_step: int) -> str:
+        """
+        Genera el texto del stepper visual.
+
+        Args:
+            current_step: Paso actual (0-based)
+
+        Returns:
+            Texto de dos líneas (estado de los pasos y etiquetas)
+        """
         steps = []
         for i in range(self.total_steps):
-            if i < self.current_step:
+            if i < current_step:
                 steps.append("(✓)")
-            elif i == self.current_step:
+            elif i == current_step:
                 steps.append("(•)")
             else:
                 steps.append("( )")
@@ -208,7 +241,7 @@ class AITableCreatorWizard(QDialog):
         stepper_text = "──".join(steps)
         labels = ["Config", "Prompt", "JSON", "Preview", "Crear"]
 
-        self.stepper_label.setText(f"{stepper_text}\n{(' ' * 6).join(labels)}")
+        return f"{stepper_text}\n{(' ' * 6).join(labels)}"
 
     def go_next(self):
         """Avanza al siguiente paso."""
@@ -237,6 +270,7 @@ class AITableCreatorWizard(QDialog):
 
         # Avanzar
         self.current_step += 1
+        self._ensure_step(self.current_step)
         self.stacked_widget.setCurrentIndex(self.current_step)
         self.update_navigation()
 
@@ -250,28 +284,29 @@ class AITableCreatorWizard(QDialog):
         """Pasa datos del paso actual al siguiente."""
         # Paso 0 → 1: config → PromptStep
         if self.current_step == 0:
-            self.prompt_config = self.step1.get_config()
-            self.step2.set_config(self.prompt_config)
+            self.prompt_config = self._steps[0].get_config()
+            self._ensure_step(1).set_config(self.prompt_config)
             logger.info(f"Config passed to step 2: {self.prompt_config.table_name}")
 
         # Paso 1 → 2: prompt generado (ya está en step2)
         elif self.current_step == 1:
-            self.generated_prompt = self.step2.get_prompt()
+            self.generated_prompt = self._steps[1].get_prompt()
             logger.info("Prompt generated and ready")
 
         # Paso 2 → 3: JSON → parse → PreviewStep
         elif self.current_step == 2:
-            self.json_text = self.step3.get_json_text()
-            self.ai_table = self.step3.get_parsed_data()
-            self.step4.set_table_data(self.ai_table)
+            json_step = self._steps[2]
+            self.json_text = json_step.get_json_text()
+            self.ai_table = json_step.get_parsed_data()
+            self._ensure_step(3).set_table_data(self.ai_table)
             logger.info(
                 f"Table data parsed: {self.ai_table.rows_count}x{self.ai_table.cols_count}"
             )
 
         # Paso 3 → 4: tabla editada → CreationStep
         elif self.current_step == 3:
-            self.ai_table = self.step4.get_final_table_data()
-            self.step5.set_table_data(self.ai_table)
+            self.ai_table = self._steps[3].get_final_table_data()
+            self._ensure_step(4).set_table_data(self.ai_table)
             logger.info("Final table data ready for creation")
 
     def update_navigation(self):
@@ -307,8 +342,12 @@ class AITableCreatorWizard(QDialog):
         """Finaliza el wizard y crea la tabla."""
         # Step 5 maneja la creación internamente
         # Solo emitir señal cuando termine
-        self.step5.creation_finished.connect(self.on_creation_finished)
-        self.step5.start_creation()
+        creation_step = self._steps[4]
+        creation_step.creation_finished.connect(self.on_creation_finished)
+        # Sin navegación mientras se crea la tabla (Cancelar sigue activo)
+        self.prev_button.setEnabled(False)
+        self.finish_button.setEnabled(False)
+        creation_step.start_creation()
 
     def on_creation_finished(self, success: bool, items_created: int):
         """
@@ -327,6 +366,14 @@ class AITableCreatorWizard(QDialog):
             QTimer.singleShot(2000, self.accept)
         else:
             logger.error("Table creation failed")
+            self.prev_button.setEnabled(True)
+
+    def reject(self):
+        """Cierra el wizard cancelando antes la creación en curso (si la hay)."""
+        creation_step = self._steps.get(4)
+        if creation_step is not None:
+            creation_step.cancel_creation()
+        super().reject()
 
     def on_controller_error(self, error_message: str):
         """Maneja errores del controlador."""
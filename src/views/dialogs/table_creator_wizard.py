@@ -8,6 +8,7 @@ Este wizard guía al usuario a través de 2 pasos:
 import sys
 from pathlib import Path
 import logging
+from functools import lru_cache
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QStackedWidget,
@@ -26,6 +27,52 @@ from controllers.table_controller import TableController
 
 logger = logging.getLogger(__name__)
 
+# Tema oscuro del wizard (se aplica una sola vez, con los hijos ya creados)
+_WIZARD_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #cccccc;
+    }
+    QLabel {
+        color: #cccccc;
+    }
+    QPushButton {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 10pt;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #3d3d3d;
+        border: 1px solid #007acc;
+    }
+    QPushButton:disabled {
+        background-color: #252525;
+        color: #666666;
+        border: 1px solid #2d2d2d;
+    }
+    QPushButton#next_button, QPushButton#finish_button {
+        background-color: #007acc;
+        color: #ffffff;
+        border: none;
+    }
+    QPushButton#next_button:hover, QPushButton#finish_button:hover {
+        background-color: #005a9e;
+    }
+"""
+
+
+@lru_cache(maxsize=None)
+def _title_font() -> QFont:
+    """Fuente de los títulos (se crea una sola vez, con QApplication ya creada)."""
+    font = QFont()
+    font.setPointSize(14)
+    font.setBold(True)
+    return font
+
 
 class TableCreatorWizard(QDialog):
     """
@@ -69,43 +116,6 @@ class TableCreatorWizard(QDialog):
         self.setFixedSize(900, 700)
         self.setModal(True)
 
-        # Aplicar tema oscuro
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #cccccc;
-            }
-            QLabel {
-                color: #cccccc;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 10pt;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border: 1px solid #007acc;
-            }
-            QPushButton:disabled {
-                background-color: #252525;
-                color: #666666;
-                border: 1px solid #2d2d2d;
-            }
-            QPushButton#next_button, QPushButton#finish_button {
-                background-color: #007acc;
-                color: #ffffff;
-                border: none;
-            }
-            QPushButton#next_button:hover, QPushButton#finish_button:hover {
-                background-color: #005a9e;
-            }
-        """)
-
         # Layout principal
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(15)
@@ -115,10 +125,7 @@ class TableCreatorWizard(QDialog):
         header_layout = QHBoxLayout()
 
         self.title_label = QLabel("Paso 1: Configuración de Tabla")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        self.title_label.setFont(title_font)
+        self.title_label.setFont(_title_font())
         header_layout.addWidget(self.title_label)
 
         header_layout.addStretch()
@@ -138,12 +145,11 @@ class TableCreatorWizard(QDialog):
         # Stacked widget para los pasos
         self.stacked_widget = QStackedWidget()
 
-        # Crear steps
+        # Crear steps (el editor se crea al pasar al paso 2)
         self.step1 = TableConfigStep(self.db, self.controller, self)
-        self.step2 = TableEditorStep(self)
+        self.step2 = None
 
         self.stacked_widget.addWidget(self.step1)
-        self.stacked_widget.addWidget(self.step2)
 
         main_layout.addWidget(self.stacked_widget, 1)
 
@@ -175,6 +181,9 @@ class TableCreatorWizard(QDialog):
 
         main_layout.addLayout(buttons_layout)
 
+        # Aplicar tema oscuro (con los hijos ya creados)
+        self.setStyleSheet(_WIZARD_QSS)
+
     def go_next(self):
         """Avanza al siguiente paso."""
         # Validar paso actual
@@ -194,6 +203,9 @@ class TableCreatorWizard(QDialog):
             self.config_data = self.step1.get_config()
 
             # Configurar paso 2 con los datos
+            if self.step2 is None:
+                self.step2 = TableEditorStep(self)
+                self.stacked_widget.addWidget(self.step2)
             self.step2.setup_table(
                 rows=self.config_data['rows'],
                 cols=self.config_data['cols'],
@@ -251,7 +263,8 @@ class TableCreatorWizard(QDialog):
         self.table_data = self.step2.get_table_data()
 
         # Validar que haya datos
-        filled_cells = sum(1 for row in self.table_data for cell in row if cell and str(cell).strip())
+        # get_table_data ya devuelve strings sin espacios: vacía == ""
+        filled_cells = sum(len(row) - row.count("") for row in self.table_data)
 
         if filled_cells == 0:
             QMessageBox.warning(
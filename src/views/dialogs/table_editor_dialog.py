@@ -6,15 +6,15 @@ Permite editar datos de una tabla ya creada
 import sys
 from pathlib import Path
 import logging
+from functools import lru_cache
 import json
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QDialog, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
     QPushButton, QLabel, QHeaderView, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
-import pyperclip
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QFont, QFontMetrics, QGuiApplication
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -23,6 +23,190 @@ from controllers.table_controller import TableController
 
 logger = logging.getLogger(__name__)
 
+# Ancho máximo de columna al abrir la tabla (px)
+_MAX_COLUMN_WIDTH = 300
+# A partir de este número de celdas no se mide todo el contenido
+# (resizeColumnsToContents); se estima con las primeras filas
+_RESIZE_ALL_MAX_CELLS = 500
+_RESIZE_SAMPLE_ROWS = 50
+# Margen horizontal de la celda (padding del QSS + bordes)
+_CELL_PADDING = 20
+
+# Tema oscuro del diálogo (mismo string para todas las instancias)
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #cccccc;
+    }
+    QLabel {
+        color: #cccccc;
+    }
+    QPushButton {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 10pt;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #3d3d3d;
+        border: 1px solid #007acc;
+    }
+    QPushButton#save_button {
+        background-color: #007acc;
+        color: #ffffff;
+        border: none;
+    }
+    QPushButton#save_button:hover {
+        background-color: #005a9e;
+    }
+    QTableView {
+        background-color: #1e1e1e;
+        alternate-background-color: #252525;
+        gridline-color: #3d3d3d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        font-size: 9pt;
+    }
+    QTableView::item {
+        padding: 5px;
+        border: none;
+    }
+    QTableView::item:selected {
+        background-color: #007acc;
+        color: #ffffff;
+    }
+    QHeaderView::section {
+        background-color: #2b2b2b;
+        color: #00d4ff;
+        padding: 8px;
+        border: 1px solid #3d3d3d;
+        font-weight: bold;
+    }
+"""
+
+
+@lru_cache(maxsize=None)
+def _title_font() -> QFont:
+    """Fuente del título (se crea una sola vez, con QApplication ya creada)."""
+    font = QFont()
+    font.setPointSize(14)
+    font.setBold(True)
+    return font
+
+
+def _parse_orden(orden_table: str) -> tuple:
+    """
+    Obtiene (fila, columna) de orden_table.
+
+    El valor lo escribe json.dumps([fila, columna]) ("[0, 1]"), así que se
+    separa directamente; cualquier otro formato pasa por json.loads.
+    """
+    try:
+        row, col = orden_table[1:-1].split(',')
+        return int(row), int(col)
+    except ValueError:
+        orden = json.loads(orden_table)
+        return orden[0], orden[1]
+
+
+class TableEditModel(QAbstractTableModel):
+    """
+    Modelo editable de la tabla: matriz de strings (filas × columnas).
+
+    La vista solo consulta las celdas visibles; las celdas editadas se
+    registran en un conjunto de (fila, columna).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # list[list[str]]
+        self._column_names = []
+        self._dirty = set()  # {(fila, columna)} editadas desde la última carga
+
+    def set_table(self, rows: list, column_names: list):
+        """Reemplaza todos los datos (un solo reset del modelo)."""
+        self.beginResetModel()
+        self._rows = rows
+        self._column_names = column_names
+        self._dirty = set()
+        self.endResetModel()
+
+    def rows(self) -> list:
+        """Retorna la matriz de datos actual."""
+        return self._rows
+
+    def dirty_cells(self) -> set:
+        """Retorna las celdas (fila, columna) editadas."""
+        return self._dirty
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._column_names)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._column_names[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole and role != Qt.ItemDataRole.EditRole:
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        row, col = index.row(), index.column()
+        if self._rows[row][col] == value:
+            return False
+        self._rows[row][col] = value
+        self._dirty.add((row, col))
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        return True
+
+    def set_block(self, row: int, col: int, block: list) -> int:
+        """
+        Escribe un bloque de valores a partir de (row, col) con un solo dataChanged.
+
+        Args:
+            row: Fila superior del bloque
+            col: Columna izquierda del bloque
+            block: Lista de filas (listas de strings); lo que excede la tabla se ignora
+
+        Returns:
+            Número de celdas cuyo valor cambió
+        """
+        changed = 0
+        max_row = min(row + len(block), len(self._rows))
+        max_col = len(self._column_names)
+        last_col = col - 1
+        for r in range(row, max_row):
+            values = block[r - row][:max_col - col]
+            target = self._rows[r]
+            for c, value in enumerate(values, col):
+                if target[c] != value:
+                    target[c] = value
+                    self._dirty.add((r, c))
+                    changed += 1
+            last_col = max(last_col, col + len(values) - 1)
+
+        if changed:
+            self.dataChanged.emit(
+                self.index(row, col), self.index(max_row - 1, last_col),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole]
+            )
+        return changed
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+
 
 class TableEditorDialog(QDialog):
     """
@@ -60,7 +244,7 @@ class TableEditorDialog(QDialog):
         self.rows = 0
         self.cols = 0
         self.column_names = []
-        self.cells = {}
+        self.cells = []  # [fila][columna] -> (content, label, item_id) o None
 
         # Track changes
         self.has_changes = False
@@ -75,59 +259,7 @@ class TableEditorDialog(QDialog):
         self.setModal(True)
 
         # Aplicar tema oscuro
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #cccccc;
-            }
-            QLabel {
-                color: #cccccc;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 10pt;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border: 1px solid #007acc;
-            }
-            QPushButton#save_button {
-                background-color: #007acc;
-                color: #ffffff;
-                border: none;
-            }
-            QPushButton#save_button:hover {
-                background-color: #005a9e;
-            }
-            QTableWidget {
-                background-color: #1e1e1e;
-                alternate-background-color: #252525;
-                gridline-color: #3d3d3d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                font-size: 9pt;
-            }
-            QTableWidget::item {
-                padding: 5px;
-                border: none;
-            }
-            QTableWidget::item:selected {
-                background-color: #007acc;
-                color: #ffffff;
-            }
-            QHeaderView::section {
-                background-color: #2b2b2b;
-                color: #00d4ff;
-                padding: 8px;
-                border: 1px solid #3d3d3d;
-                font-weight: bold;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
 
         # Layout principal
         layout = QVBoxLayout(self)
@@ -138,10 +270,7 @@ class TableEditorDialog(QDialog):
         header_layout = QHBoxLayout()
 
         title = QLabel(f"✏️ Editar: {self.table_name}")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_title_font())
         title.setStyleSheet("color: #00d4ff;")
         header_layout.addWidget(title)
 
@@ -162,15 +291,18 @@ class TableEditorDialog(QDialog):
         instructions.setStyleSheet("color: #aaaaaa; font-size: 9pt; padding: 5px;")
         layout.addWidget(instructions)
 
-        # Tabla editable
-        self.table = QTableWidget()
+        # Tabla editable (vista sobre TableEditModel)
+        self.model = TableEditModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self.table.verticalHeader().setDefaultSectionSize(30)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
 
-        # Conectar señal de cambio
-        self.table.itemChanged.connect(self.on_cell_changed)
+        # Conectar señal de cambio (se desconecta tras el primer cambio)
+        self.model.dataChanged.connect(self.on_cell_changed)
+        self._watching_changes = True
 
         layout.addWidget(self.table, 1)
 
@@ -238,73 +370,95 @@ class TableEditorDialog(QDialog):
         """Reconstruye la estructura de tabla desde items de BD."""
         max_row = 0
         max_col = 0
-        self.cells = {}
+        positioned = []  # [(fila, columna, item)]
 
         for item in self.table_items:
-            try:
-                orden = json.loads(item['orden_table'])
-                row, col = orden[0], orden[1]
-
-                max_row = max(max_row, row)
-                max_col = max(max_col, col)
-
-                self.cells[(row, col)] = {
-                    'content': item['content'],
-                    'label': item['label'],
-                    'item_id': item['id']
-                }
-
-            except (json.JSONDecodeError, KeyError, IndexError) as e:
-                logger.warning(f"Invalid orden_table for item {item.get('id')}: {e}")
-                continue
+            row = item.get('orden_row')
+            col = item.get('orden_col')
+            if row is None or col is None:
+                # Items sin columnas enteras (escritos por otra vía): usar orden_table
+                try:
+                    row, col = _parse_orden(item['orden_table'])
+                except (ValueError, KeyError, IndexError, TypeError) as e:
+                    logger.warning(f"Invalid orden_table for item {item.get('id')}: {e}")
+                    continue
+
+            if row > max_row:
+                max_row = row
+            if col > max_col:
+                max_col = col
+            positioned.append((row, col, item))
 
         self.rows = max_row + 1
         self.cols = max_col + 1
 
-        # Extraer nombres de columnas
-        self.column_names = []
-        for col in range(self.cols):
-            cell = self.cells.get((0, col))
-            if cell:
-                self.column_names.append(cell['label'])
-            else:
-                self.column_names.append(f"COL_{col+1}")
-
-    def populate_table(self):
-        """Llena el QTableWidget con los datos."""
-        # Bloquear señales temporalmente
-        self.table.blockSignals(True)
+        # Matriz [fila][columna] de (content, label, item_id); None = celda vacía
+        self.cells = [[None] * self.cols for _ in range(self.rows)]
+        for row, col, item in positioned:
+            self.cells[row][col] = (item['content'], item['label'], item['id'])
 
-        # Configurar tabla
-        self.table.setRowCount(self.rows)
-        self.table.setColumnCount(self.cols)
-        self.table.setHorizontalHeaderLabels(self.column_names)
+        # Extraer nombres de columnas (etiquetas de la primera fila)
+        self.column_names = [
+            cell[1] if cell is not None else f"COL_{col+1}"
+            for col, cell in enumerate(self.cells[0])
+        ]
 
-        # Llenar celdas
-        for (row, col), cell_data in self.cells.items():
-            content = cell_data['content']
-            item = QTableWidgetItem(content)
-            self.table.setItem(row, col, item)
+    def populate_table(self):
+        """Carga los datos en el modelo de la tabla."""
+        # Matriz completa en Python y un solo reset del modelo
+        rows = [
+            [(cell[0] or "") if cell is not None else "" for cell in grid_row]
+            for grid_row in self.cells
+        ]
+        self.model.set_table(rows, self.column_names)
 
         # Actualizar label de dimensiones
         self.dimensions_label.setText(f"{self.rows} filas × {self.cols} columnas")
 
-        # Auto-resize columnas
-        self.table.resizeColumnsToContents()
-
-        # Limitar ancho máximo
-        for col in range(self.cols):
-            width = self.table.columnWidth(col)
-            if width > 300:
-                self.table.setColumnWidth(col, 300)
+        if self.rows * self.cols > _RESIZE_ALL_MAX_CELLS:
+            # Tabla grande: ancho según el texto más largo de las primeras filas
+            metrics = QFontMetrics(self.table.font())
+            header = self.table.horizontalHeader()
+            sample = rows[:_RESIZE_SAMPLE_ROWS]
+            for col in range(self.cols):
+                longest = max((row[col] for row in sample), key=len, default="")
+                longest = max(longest, self.column_names[col], key=len)
+                width = metrics.horizontalAdvance(longest) + _CELL_PADDING
+                header.resizeSection(col, min(width, _MAX_COLUMN_WIDTH))
+            return
 
-        # Reactivar señales
-        self.table.blockSignals(False)
+        self.table.setUpdatesEnabled(False)
+        try:
+            # Auto-resize columnas
+            self.table.resizeColumnsToContents()
+
+            # Limitar ancho máximo
+            for col in range(self.cols):
+                width = self.table.columnWidth(col)
+                if width > _MAX_COLUMN_WIDTH:
+                    self.table.setColumnWidth(col, _MAX_COLUMN_WIDTH)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+    def on_cell_changed(self, top_left, bottom_right, roles=None):
+        """
+        Marca la tabla como modificada.
 
-    def on_cell_changed(self, item):
-        """Maneja cambios en celdas."""
+        Basta con el primer cambio: la señal se desconecta hasta que se
+        guarda o se recarga la tabla (_mark_clean).
+        """
         self.has_changes = True
-        logger.debug(f"Cell changed: [{item.row()}, {item.column()}]")
+        self.model.dataChanged.disconnect(self.on_cell_changed)
+        self._watching_changes = False
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cell changed: [{top_left.row()}, {top_left.column()}]")
+
+    def _mark_clean(self):
+        """Limpia has_changes y vuelve a escuchar cambios del modelo."""
+        self.has_changes = False
+        if not self._watching_changes:
+            self.model.dataChanged.connect(self.on_cell_changed)
+            self._watching_changes = True
 
     def reset_table(self):
         """Recarga datos originales descartando cambios."""
@@ -321,7 +475,7 @@ class TableEditorDialog(QDialog):
 
         # Recargar datos
         self.load_table_data()
-        self.has_changes = False
+        self._mark_clean()
 
         logger.info("Table reset to original data")
 
@@ -362,24 +516,20 @@ class TableEditorDialog(QDialog):
             return
 
         try:
-            # Obtener datos actuales de la tabla
-            table_data = []
-            for row in range(self.rows):
-                row_data = []
-                for col in range(self.cols):
-                    item = self.table.item(row, col)
-                    cell_value = item.text() if item else ""
-                    row_data.append(cell_value)
-                table_data.append(row_data)
+            # Solo las celdas editadas (fila, columna, valor), en orden
+            rows = self.model.rows()
+            updates = [(row, col, rows[row][col]) for row, col in sorted(self.model.dirty_cells())]
 
             # Usar controller para actualizar
             result = self.table_controller.update_table(
                 table_name=self.table_name,
-                table_data=table_data,
-                column_names=self.column_names
+                column_names=self.column_names,
+                updates=updates
             )
 
             if result['success']:
+                self._mark_clean()
+
                 QMessageBox.information(
                     self,
                     "Cambios Guardados",
@@ -423,56 +573,35 @@ class TableEditorDialog(QDialog):
     def paste_from_clipboard(self):
         """Pega datos desde el portapapeles."""
         try:
-            clipboard_text = pyperclip.paste()
+            # Portapapeles de Qt: llamada en proceso (pyperclip lanza un
+            # subproceso en algunas plataformas y bloquea la UI)
+            clipboard_text = QGuiApplication.clipboard().text()
 
             if not clipboard_text.strip():
                 return
 
-            # Parsear datos (TSV o CSV)
-            lines = clipboard_text.strip().split('\n')
+            # Parsear datos (TSV o CSV); el separador se detecta una sola vez
+            lines = clipboard_text.splitlines()
+            sep = '\t' if '\t' in clipboard_text else ','
 
             # Obtener celda actual
-            current_row = self.table.currentRow()
-            current_col = self.table.currentColumn()
+            current = self.table.currentIndex()
+            current_row = current.row()
+            current_col = current.column()
 
             if current_row < 0 or current_col < 0:
                 current_row = 0
                 current_col = 0
 
-            # Bloquear señales
-            self.table.blockSignals(True)
-
-            # Pegar datos
-            pasted_cells = 0
-            for line_idx, line in enumerate(lines):
-                target_row = current_row + line_idx
-                if target_row >= self.rows:
-                    break
-
-                # Separar por tabs o comas
-                if '\t' in line:
-                    cells = line.split('\t')
-                else:
-                    cells = line.split(',')
-
-                for cell_idx, cell_value in enumerate(cells):
-                    target_col = current_col + cell_idx
-                    if target_col >= self.cols:
-                        break
-
-                    item = self.table.item(target_row, target_col)
-                    if item:
-                        item.setText(cell_value.strip())
-                        pasted_cells += 1
-
-            # Reactivar señales
-            self.table.blockSignals(False)
-
-            # Marcar como modificado
-            if pasted_cells > 0:
-                self.has_changes = True
+            # Pegar datos: el modelo escribe el bloque y emite un solo dataChanged
+            # (has_changes lo marca on_cell_changed, solo si algún valor cambió)
+            block = [
+                [cell.strip() for cell in line.split(sep)]
+                for line in lines[:max(self.rows - current_row, 0)]
+            ]
+            pasted_cells = self.model.set_block(current_row, current_col, block)
 
-            logger.info(f"Pasted {pasted_cells} cells from clipboard")
+            logger.info(f"Pasted from clipboard: {pasted_cells} cells changed")
 
         except Exception as e:
             logger.error(f"Error pasting: {e}")
@@ -190,11 +190,11 @@ class TableRenameDialog(QDialog):
         # Obtener lista de tablas existentes
         try:
             tables = self.db.get_all_tables()
-            existing_tables = [table['name'] for table in tables]
+            existing_tables = {table['name'] for table in tables}
 
         except Exception as e:
             logger.error(f"Error getting existing tables: {e}")
-            existing_tables = []
+            existing_tables = set()
 
         # Validar nombre usando TableValidator
         is_valid, error_msg = TableValidator.validate_table_name(
@@ -19,7 +19,7 @@ from PyQt6.QtWidgets import (
     QFormLayout, QGroupBox, QScrollArea, QCheckBox,
     QPushButton, QTableWidget, QTableWidgetItem, QHeaderView
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont
 
 # Agregar path al sys.path para imports
@@ -33,6 +33,30 @@ from core.global_tag_manager import GlobalTagManager
 logger = logging.getLogger(__name__)
 
 
+class _CategoriesLoaderSignals(QObject):
+    """Señales del loader de categorías (QRunnable no es QObject)."""
+
+    loaded = pyqtSignal(list)  # Lista de categorías
+
+
+class _CategoriesLoader(QRunnable):
+    """Carga las categorías de la BD en un hilo del QThreadPool."""
+
+    def __init__(self, db_manager: DBManager):
+        super().__init__()
+        self.db = db_manager
+        self.signals = _CategoriesLoaderSignals()
+
+    def run(self):
+        """Ejecuta la consulta y emite el resultado (lista vacía si falla)."""
+        try:
+            categories = self.db.get_categories()
+        except Exception as e:
+            logger.error(f"Error loading categories: {e}")
+            categories = []
+        self.signals.loaded.emit(categories)
+
+
 class AITableConfigStep(QWidget):
     """
     Step 1: Configuración de prompt para IA.
@@ -131,9 +155,11 @@ class AITableConfigStep(QWidget):
         self.table_name_input.setStyleSheet(self._get_input_style())
         basic_layout.addRow("Nombre de Tabla:", self.table_name_input)
 
-        # Categoría
+        # Categoría (se llena al terminar la carga en segundo plano)
         self.category_combo = QComboBox()
         self.category_combo.setStyleSheet(self._get_combo_style())
+        self.category_combo.setPlaceholderText("Cargando categorías...")
+        self.category_combo.setEnabled(False)
         basic_layout.addRow("Categoría:", self.category_combo)
 
         # Tags con ProjectTagSelector
@@ -303,20 +329,30 @@ class AITableConfigStep(QWidget):
                 self.columns_table.setCellWidget(i, 2, sensitive_checkbox)
 
     def load_categories(self):
-        """Carga las categorías desde la base de datos."""
-        try:
-            self.categories = self.db.get_categories()
-            self.category_combo.clear()
-
-            for category in self.categories:
-                self.category_combo.addItem(
-                    f"{category['icon']} {category['name']}",
-                    category['id']
-                )
+        """
+        Carga las categorías desde la base de datos en segundo plano.
 
-            logger.info(f"Loaded {len(self.categories)} categories")
-        except Exception as e:
-            logger.error(f"Error loading categories: {e}")
+        El combo se llena en _on_categories_loaded; si el step se destruye
+        antes, Qt descarta la señal pendiente.
+        """
+        loader = _CategoriesLoader(self.db)
+        loader.signals.loaded.connect(self._on_categories_loaded)
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_categories_loaded(self, categories: list):
+        """Llena el combo de categorías con el resultado del loader."""
+        self.categories = categories
+        self.category_combo.clear()
+
+        for category in self.categories:
+            self.category_combo.addItem(
+                f"{category['icon']} {category['name']}",
+                category['id']
+            )
+
+        self.category_combo.setPlaceholderText("")
+        self.category_combo.setEnabled(True)
+        logger.info(f"Loaded {len(self.categories)} categories")
 
     def get_config(self) -> AITablePromptConfig:
         """
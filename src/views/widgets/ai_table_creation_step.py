@@ -27,7 +27,12 @@ logger = logging.getLogger(__name__)
 
 
 class CreationWorker(QThread):
-    """Worker thread para creación de tabla."""
+    """
+    Worker thread para creación de tabla.
+
+    Se cancela con requestInterruption(): la creación se revierte en el
+    siguiente lote de filas.
+    """
 
     progress = pyqtSignal(int, str)  # (percentage, message)
     finished = pyqtSignal(bool, dict)  # (success, result)
@@ -42,12 +47,12 @@ class CreationWorker(QThread):
         try:
             self.progress.emit(10, "Validando datos...")
 
-            self.progress.emit(30, "Preparando items...")
-
-            self.progress.emit(50, "Creando tabla en base de datos...")
+            self.progress.emit(30, "Creando tabla en base de datos...")
 
-            # Crear tabla
-            result = self.ai_manager.create_table_from_ai(self.ai_table)
+            # Crear tabla (progreso real por filas: 30% → 90%)
+            result = self.ai_manager.create_table_from_ai(
+                self.ai_table, progress_callback=self._on_rows_progress
+            )
 
             self.progress.emit(90, "Finalizando...")
 
@@ -64,6 +69,13 @@ class CreationWorker(QThread):
                 'items_created': 0
             })
 
+    def _on_rows_progress(self, rows_done: int, rows_total: int) -> bool:
+        """Reporta el progreso de filas; retorna False si se pidió cancelar."""
+        if rows_total:
+            percentage = 30 + rows_done * 60 // rows_total
+            self.progress.emit(percentage, f"Creando items (fila {rows_done + 1}/{rows_total})...")
+        return not self.isInterruptionRequested()
+
 
 class AITableCreationStep(QWidget):
     """Step 5: Creación de tabla."""
@@ -199,6 +211,19 @@ class AITableCreationStep(QWidget):
         self.worker.finished.connect(self.on_finished)
         self.worker.start()
 
+    def cancel_creation(self):
+        """
+        Cancela la creación en curso (si la hay).
+
+        Espera a que el worker termine: la cancelación se atiende entre lotes
+        de filas y la transacción se revierte.
+        """
+        if self.worker is None or not self.worker.isRunning():
+            return
+        self.log("Cancelando creación...")
+        self.worker.requestInterruption()
+        self.worker.wait()
+
     def on_progress(self, percentage: int, message: str):
         """Actualiza el progreso."""
         self.progress_bar.setValue(percentage)
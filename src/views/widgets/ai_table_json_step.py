@@ -174,7 +174,7 @@ class AITableJSONStep(QWidget):
         validation_result = self.ai_manager.validate_json(json_text)
 
         if validation_result.is_valid:
-            # Parsear datos
+            # Parsear datos (la cabecera ya se validó: una sola lectura más)
             self.json_text = json_text
             self.parsed_data, errors = self.ai_manager.parse_json(json_text)
 
@@ -63,7 +63,8 @@ class TableConfigStep(QWidget):
             logger.error(f"Could not initialize GlobalTagManager: {e}")
 
         self.init_ui()
-        self.load_categories()
+        # Las categorías se cargan al mostrarse el step por primera vez
+        self._categories_loaded = False
 
     def init_ui(self):
         """Inicializa la interfaz del step."""
@@ -353,6 +354,13 @@ class TableConfigStep(QWidget):
             self.column_url_checks.append(url_check)
             self.column_sensitive_checks.append(sensitive_check)
 
+    def showEvent(self, event):
+        """Carga las categorías la primera vez que se muestra el step."""
+        if not self._categories_loaded:
+            self._categories_loaded = True
+            self.load_categories()
+        super().showEvent(event)
+
     def load_categories(self):
         """Carga las categorías en el combo."""
         try: